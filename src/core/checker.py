@@ -7,20 +7,65 @@ Implementa la lógica principal para verificar el estado y rendimiento de sitios
 import urllib.request
 import urllib.error
 import ssl
+import sys
 import socket
 import logging
 import json
 import asyncio
+import threading
+import functools
+import time
 import aiohttp
-from typing import Optional, Tuple, Dict, List
+import numpy as np
+from multidict import CIMultiDict
+from typing import Callable, Optional, Tuple, Dict, List, Mapping
 from datetime import datetime, timedelta
 from urllib.parse import urlparse
-from concurrent.futures import ThreadPoolExecutor
-from dataclasses import dataclass
-from email.utils import formatdate
+from dataclasses import dataclass, field
 import hashlib
 
-@dataclass
+from .history import HistoryBuffer
+from .metrics import MetricsStore
+
+try:
+    import orjson
+except ImportError:  # orjson es opcional; se usa json de la stdlib
+    orjson = None
+
+try:
+    import uvloop
+except ImportError:  # uvloop es opcional (no disponible en Windows)
+    uvloop = None
+
+# Número máximo de verificaciones guardadas en el historial de cada URL
+MAX_HISTORY_PER_URL = 1000
+
+# Tiempo que se mantienen abiertas las conexiones inactivas (segundos)
+KEEPALIVE_TIMEOUT_HTTPS = 60
+KEEPALIVE_TIMEOUT_HTTP = 15
+
+# Pesos de cada factor en el score de salud
+UPTIME_WEIGHT = 0.4
+RESPONSE_TIME_WEIGHT = 0.3
+SUCCESS_RATE_WEIGHT = 0.3
+
+# Tiempo máximo que se reutiliza la información de un certificado (segundos)
+CERT_CACHE_TTL = 600
+
+# Bytes máximos del cuerpo que se leen y descartan para devolver la conexión
+# al pool; con cuerpos mayores sale más barato cerrarla y abrir otra
+MAX_DRAIN_BYTES = 8 * 1024 * 1024
+
+@functools.lru_cache(maxsize=4096)
+def _parse_url(url: str) -> Tuple[str, str, bool]:
+    """Descompone una URL en (netloc, esquema, es_https), cacheando el resultado."""
+    parsed = urlparse(url)
+    return parsed.netloc, parsed.scheme, parsed.scheme == 'https'
+
+# slots=True solo está disponible a partir de Python 3.10
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_DATACLASS_OPTIONS)
 class CheckResult:
     """Clase para almacenar el resultado de una verificación."""
     status_code: int
@@ -29,12 +74,29 @@ class CheckResult:
     server: Optional[str] = None
     content_length: Optional[int] = None
     ssl_info: Optional[Dict] = None
-    headers: Optional[Dict] = None
+    headers: Optional[Mapping[str, str]] = None
     encoding: Optional[str] = None
     redirect_url: Optional[str] = None
-    timestamp: datetime = datetime.now()
+    timestamp: datetime = field(default_factory=datetime.now)
     error: Optional[str] = None
 
+class _TLSClientResponse(aiohttp.ClientResponse):
+    """
+    Respuesta de aiohttp que conserva el objeto SSL de su conexión.
+    
+    aiohttp libera la conexión en cuanto el cuerpo llega completo (con HEAD,
+    antes de devolver la respuesta), así que el objeto SSL se guarda al
+    empezar a leerla, mientras la conexión todavía pertenece a la respuesta.
+    """
+    
+    ssl_object: Optional[ssl.SSLObject] = None
+    
+    async def start(self, connection):
+        transport = connection.transport
+        if transport is not None:
+            self.ssl_object = transport.get_extra_info('ssl_object')
+        return await super().start(connection)
+
 class WebsiteChecker:
     """Clase principal para verificar el estado y rendimiento de sitios web."""
     
@@ -42,7 +104,12 @@ class WebsiteChecker:
                  timeout: int = 10,
                  max_redirects: int = 5,
                  verify_ssl: bool = True,
-                 cache_duration: int = 300):
+                 cache_duration: int = 300,
+                 max_connections: int = 100,
+                 max_connections_per_host: int = 10,
+                 max_concurrency: int = 50,
+                 head_only: bool = False,
+                 session_factory: Callable[..., aiohttp.ClientSession] = aiohttp.ClientSession):
         """
         Inicializa el checker con configuraciones personalizables.
         
@@ -51,36 +118,63 @@ class WebsiteChecker:
             max_redirects (int): Número máximo de redirecciones permitidas
             verify_ssl (bool): Verificar certificados SSL
             cache_duration (int): Duración del caché en segundos
+            max_connections (int): Conexiones simultáneas máximas del pool
+            max_connections_per_host (int): Conexiones simultáneas máximas por host
+            max_concurrency (int): Verificaciones simultáneas máximas en bulk_check
+            head_only (bool): Usar peticiones HEAD (sin descargar el cuerpo). Con
+                GET el cuerpo se lee y se descarta para reutilizar la conexión
+            session_factory (Callable): Crea las sesiones HTTP; recibe los mismos
+                argumentos que aiohttp.ClientSession (útil para pruebas)
         """
         self.timeout = timeout
         self.max_redirects = max_redirects
         self.verify_ssl = verify_ssl
         self.cache_duration = cache_duration
+        self.max_connections = max_connections
+        self.max_connections_per_host = max_connections_per_host
+        self.max_concurrency = max_concurrency
+        self.head_only = head_only
+        self.session_factory = session_factory
         
         self._setup_logging()
         self._init_storage()
         
-        # Configuración de headers
-        self.headers = {
+        # Configuración de headers (se pasan una sola vez a la sesión compartida)
+        self.headers = CIMultiDict({
             'User-Agent': 'WebsiteChecker/2.0',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
             'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-            'Date': formatdate(timeval=None, localtime=False, usegmt=True)
-        }
+            'Connection': 'keep-alive'
+        })
         
         # Configurar el contexto SSL
         self.ssl_context = self._setup_ssl_context()
         
-        # Caché para resultados
-        self._cache: Dict[str, Tuple[CheckResult, datetime]] = {}
+        # Contexto para leer certificados: sin verificación, getpeercert()
+        # no devuelve sus campos, así que se usa uno que sí verifica
+        self._cert_ssl_context = self.ssl_context if self.verify_ssl else ssl.create_default_context()
+        
+        # Caché para resultados (resultado, expiración en reloj monotónico)
+        self._cache: Dict[str, Tuple[CheckResult, float]] = {}
+        
+        # Caché de certificados por huella SHA-256 (info, expiración)
+        self._cert_cache: Dict[str, Tuple[dict, datetime]] = {}
+        
+        # Certificados obtenidos con conexiones propias, por host (info,
+        # expiración en reloj monotónico); también se guardan los fallos
+        self._host_cert_cache: Dict[str, Tuple[Optional[dict], float]] = {}
         
         # Métricas y estadísticas
-        self.metrics: Dict[str, dict] = {}
+        self.metrics = MetricsStore()
+        
+        # Sesiones HTTP compartidas por esquema (se crean bajo demanda)
+        self._sessions: Dict[bool, aiohttp.ClientSession] = {}
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
         
-        # Pool de hilos para operaciones paralelas
-        self.thread_pool = ThreadPoolExecutor(max_workers=10)
+        # Event loop dedicado para la API síncrona
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_lock = threading.Lock()
     
     def _setup_logging(self):
         """Configura el sistema de logging."""
@@ -96,11 +190,15 @@ class WebsiteChecker:
     
     def _init_storage(self):
         """Inicializa el almacenamiento de históricos."""
-        self._history: Dict[str, List[dict]] = {}
-        self._metrics: Dict[str, dict] = {}
+        self._history: Dict[str, HistoryBuffer] = {}
     
     def _setup_ssl_context(self) -> ssl.SSLContext:
-        """Configura el contexto SSL con opciones de seguridad."""
+        """
+        Configura el contexto SSL con opciones de seguridad.
+        
+        El contexto se crea una sola vez y se comparte entre todas las
+        conexiones.
+        """
         context = ssl.create_default_context()
         if not self.verify_ssl:
             context.check_hostname = False
@@ -109,17 +207,121 @@ class WebsiteChecker:
     
     def _get_cached_result(self, url: str) -> Optional[CheckResult]:
         """Obtiene el resultado cacheado si está disponible y válido."""
-        if url in self._cache:
-            result, timestamp = self._cache[url]
-            if datetime.now() - timestamp < timedelta(seconds=self.cache_duration):
+        entry = self._cache.get(url)
+        if entry is not None:
+            result, expires_at = entry
+            if expires_at > time.monotonic():
                 return result
-            else:
-                del self._cache[url]
+            del self._cache[url]
         return None
     
     def _cache_result(self, url: str, result: CheckResult):
-        """Almacena el resultado en caché."""
-        self._cache[url] = (result, datetime.now())
+        """Almacena el resultado en caché junto con su instante de expiración."""
+        self._cache[url] = (result, time.monotonic() + self.cache_duration)
+    
+    async def _get_session(self, is_https: bool = True) -> aiohttp.ClientSession:
+        """
+        Obtiene la sesión HTTP compartida para el esquema, creándola si es necesario.
+        
+        Reutilizar la sesión permite aprovechar el pool de conexiones de
+        aiohttp y evita un handshake TCP/TLS completo en cada verificación.
+        HTTP y HTTPS usan sesiones separadas para que las conexiones TLS,
+        más costosas de abrir, no compitan con las de HTTP plano.
+        
+        Args:
+            is_https (bool): Obtener la sesión para HTTPS en lugar de HTTP
+        """
+        loop = asyncio.get_running_loop()
+        if self._session_loop is not loop:
+            # Las sesiones pertenecen al loop en el que se crearon
+            self._discard_sessions(self._sessions, self._session_loop)
+            self._sessions = {}
+            self._session_loop = loop
+        
+        session = self._sessions.get(is_https)
+        if session is None or session.closed:
+            session = self.session_factory(
+                connector=aiohttp.TCPConnector(
+                    limit=self.max_connections,
+                    limit_per_host=self.max_connections_per_host,
+                    use_dns_cache=True,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=KEEPALIVE_TIMEOUT_HTTPS if is_https else KEEPALIVE_TIMEOUT_HTTP,
+                    enable_cleanup_closed=is_https,
+                    ssl=self.ssl_context
+                ),
+                headers=self.headers,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                response_class=_TLSClientResponse
+            )
+            self._sessions[is_https] = session
+        return session
+    
+    @staticmethod
+    def _discard_sessions(sessions: Dict[bool, aiohttp.ClientSession],
+                          loop: Optional[asyncio.AbstractEventLoop]):
+        """
+        Cierra las sesiones creadas en otro event loop.
+        
+        Si ese loop sigue en marcha (en otro hilo), el cierre se programa en
+        él; si ya terminó, se separa el conector de la sesión y se cierran
+        sus conexiones de forma síncrona.
+        
+        Args:
+            sessions (Dict[bool, aiohttp.ClientSession]): Sesiones a cerrar
+            loop (Optional[asyncio.AbstractEventLoop]): Loop en el que se crearon
+        """
+        for session in sessions.values():
+            if session.closed:
+                continue
+            if loop is not None and loop.is_running() and not loop.is_closed():
+                asyncio.run_coroutine_threadsafe(session.close(), loop)
+            else:
+                connector = session.connector
+                session.detach()
+                if connector is not None:
+                    connector._close()
+    
+    async def close(self):
+        """Cierra las sesiones HTTP compartidas."""
+        sessions, self._sessions = self._sessions, {}
+        for session in sessions.values():
+            if not session.closed:
+                await session.close()
+        self._session_loop = None
+    
+    async def __aenter__(self):
+        """Permite usar el checker como context manager asíncrono."""
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        """Cierra la sesión al salir del context manager."""
+        await self.close()
+    
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        """
+        Obtiene el event loop dedicado, iniciándolo en un hilo de fondo si es necesario.
+        
+        Si uvloop está instalado se usa como implementación del loop.
+        """
+        with self._loop_lock:
+            if self._loop is None or self._loop.is_closed():
+                self._loop = uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
+                threading.Thread(
+                    target=self._loop.run_forever,
+                    name="WebsiteCheckerLoop",
+                    daemon=True
+                ).start()
+            return self._loop
+    
+    def shutdown(self):
+        """Cierra la sesión y detiene el event loop de la API síncrona."""
+        with self._loop_lock:
+            loop, self._loop = self._loop, None
+        if loop is None or loop.is_closed():
+            return
+        asyncio.run_coroutine_threadsafe(self.close(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
     
     async def check_website_async(self, url: str) -> CheckResult:
         """
@@ -127,7 +329,7 @@ class WebsiteChecker:
         
         Args:
             url (str): URL del sitio web a verificar
-
+        
         Returns:
             CheckResult: Objeto con los resultados de la verificación
         """
@@ -137,39 +339,39 @@ class WebsiteChecker:
             if cached_result:
                 return cached_result
             
-            start_time = datetime.now()
+            start_time = time.monotonic()
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    url,
-                    headers=self.headers,
-                    timeout=self.timeout,
-                    max_redirects=self.max_redirects,
-                    ssl=self.ssl_context if self.verify_ssl else False
-                ) as response:
-                    end_time = datetime.now()
-                    
-                    result = CheckResult(
-                        status_code=response.status,
-                        response_time=(end_time - start_time).total_seconds() * 1000,
-                        content_type=response.headers.get('Content-Type'),
-                        server=response.headers.get('Server'),
-                        content_length=int(response.headers.get('Content-Length', 0)),
-                        headers=dict(response.headers),
-                        encoding=response.get_encoding(),
-                        redirect_url=str(response.url) if str(response.url) != url else None,
-                    )
-                    
-                    # Verificar SSL si es HTTPS
-                    if url.startswith('https'):
-                        result.ssl_info = await self._get_ssl_info_async(url)
-                    
-                    self._cache_result(url, result)
-                    self._update_metrics(url, result)
-                    self._record_check(url, result)
-                    
-                    return result
-                    
+            _, _, is_https = _parse_url(url)
+            session = await self._get_session(is_https)
+            async with await self._send_request(session, url) as response:
+                elapsed_ms = (time.monotonic() - start_time) * 1000.0
+                
+                # Las cabeceras se guardan como la vista inmutable de aiohttp,
+                # sin copiarlas a un dict
+                headers = response.headers
+                result = CheckResult(
+                    status_code=response.status,
+                    response_time=elapsed_ms,
+                    content_type=headers.get('Content-Type'),
+                    server=headers.get('Server'),
+                    content_length=response.content_length or 0,
+                    headers=headers,
+                    encoding=response.charset,
+                    redirect_url=str(response.url) if str(response.url) != url else None,
+                )
+                
+                # Verificar SSL si es HTTPS
+                if is_https:
+                    result.ssl_info = await self._get_ssl_info(url, response)
+                
+                await self._drain(response)
+                
+                self._cache_result(url, result)
+                self._update_metrics(url, result)
+                self._record_check(url, result)
+                
+                return result
+        
         except Exception as e:
             self.logger.error(f"Error checking {url}: {str(e)}")
             return CheckResult(
@@ -178,98 +380,178 @@ class WebsiteChecker:
                 error=str(e)
             )
     
+    async def _send_request(self, session: aiohttp.ClientSession, url: str) -> aiohttp.ClientResponse:
+        """
+        Envía la petición y devuelve la respuesta en cuanto llegan las cabeceras.
+        
+        En modo ``head_only`` se usa HEAD y, si el servidor no lo admite, se
+        recurre a GET. El cuerpo de las respuestas GET lo descarta _drain.
+        """
+        if self.head_only:
+            response = await session.head(
+                url,
+                allow_redirects=True,
+                max_redirects=self.max_redirects
+            )
+            if response.status not in (405, 501):
+                return response
+            response.release()
+        
+        return await session.get(url, max_redirects=self.max_redirects)
+    
+    @staticmethod
+    async def _drain(response: aiohttp.ClientResponse):
+        """
+        Lee y descarta el cuerpo de la respuesta sin guardarlo.
+        
+        aiohttp solo devuelve la conexión al pool si el cuerpo se leyó
+        completo; si se libera antes, la cierra. Se leen como máximo
+        MAX_DRAIN_BYTES: con cuerpos mayores se deja que la cierre.
+        """
+        remaining = MAX_DRAIN_BYTES
+        while remaining > 0:
+            chunk = await response.content.readany()
+            if not chunk:
+                return
+            remaining -= len(chunk)
+    
     def check_website(self, url: str) -> CheckResult:
         """
         Versión síncrona de check_website_async.
         
         Args:
             url (str): URL del sitio web a verificar
-
+        
         Returns:
             CheckResult: Objeto con los resultados de la verificación
         """
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            return loop.run_until_complete(self.check_website_async(url))
-        finally:
-            loop.close()
+        future = asyncio.run_coroutine_threadsafe(
+            self.check_website_async(url),
+            self._get_loop()
+        )
+        return future.result()
+    
+    @staticmethod
+    def _parse_cert(cert: dict) -> Dict:
+        """Extrae los campos relevantes de un certificado decodificado."""
+        return {
+            'issuer': dict(x[0] for x in cert['issuer']),
+            'subject': dict(x[0] for x in cert['subject']),
+            'version': cert['version'],
+            'expires': cert['notAfter'],
+            'serial_number': cert['serialNumber']
+        }
+    
+    def _get_cert_info(self, ssl_object: ssl.SSLObject) -> Optional[Dict]:
+        """Obtiene la información del certificado del par, usando la caché por huella."""
+        der = ssl_object.getpeercert(binary_form=True)
+        if not der:
+            return None
+        
+        # Reutilizar la información si el certificado ya fue procesado
+        fingerprint = hashlib.sha256(der).hexdigest()
+        cached = self._cert_cache.get(fingerprint)
+        if cached and cached[1] > datetime.now():
+            return cached[0]
+        
+        cert = ssl_object.getpeercert()
+        if not cert:
+            return None
+        
+        info = self._parse_cert(cert)
+        
+        # No cachear más allá de la fecha de expiración del certificado
+        not_after = datetime.fromtimestamp(ssl.cert_time_to_seconds(cert['notAfter']))
+        expires = min(datetime.now() + timedelta(seconds=CERT_CACHE_TTL), not_after)
+        self._cert_cache[fingerprint] = (info, expires)
+        return info
     
-    async def _get_ssl_info_async(self, url: str) -> Dict:
-        """Obtiene información del certificado SSL de forma asíncrona."""
+    async def _get_ssl_info(self, url: str, response: aiohttp.ClientResponse) -> Optional[Dict]:
+        """
+        Obtiene la información SSL de la conexión que atendió la respuesta.
+        
+        Reutiliza el handshake ya realizado por aiohttp a través del objeto
+        SSL que guarda _TLSClientResponse. Solo se abre una conexión propia
+        si la respuesta no lo tiene o si verify_ssl es False (la conexión de
+        aiohttp no verifica el certificado y getpeercert() no devuelve sus
+        campos), y como mucho una vez por host cada CERT_CACHE_TTL segundos.
+        Si esa conexión falla (por ejemplo, con un certificado autofirmado)
+        se devuelve la información vacía del certificado presentado.
+        """
+        ssl_object = getattr(response, 'ssl_object', None)
+        has_cert = False
+        if ssl_object is not None:
+            try:
+                info = self._get_cert_info(ssl_object)
+                has_cert = bool(ssl_object.getpeercert(binary_form=True))
+            except Exception as e:
+                self.logger.error(f"Error getting SSL info for {url}: {str(e)}")
+                return None
+            if info is not None or self.verify_ssl:
+                return info
+        
+        host, _, _ = _parse_url(url)
+        cached = self._host_cert_cache.get(host)
+        if cached is not None and cached[1] > time.monotonic():
+            info = cached[0]
+        else:
+            info = await self._get_ssl_info_async(url)
+            self._host_cert_cache[host] = (info, time.monotonic() + CERT_CACHE_TTL)
+        
+        if info is None and has_cert:
+            # Certificado presentado pero no verificable: sin sus campos
+            return {'issuer': {}, 'subject': {}, 'version': None, 'expires': None, 'serial_number': None}
+        return info
+    
+    async def _get_ssl_info_async(self, url: str) -> Optional[Dict]:
+        """Obtiene información del certificado SSL abriendo una conexión propia."""
         try:
-            host = urlparse(url).netloc
-            context = ssl.create_default_context()
+            parsed = urlparse(url)
+            host = parsed.hostname
             
             reader, writer = await asyncio.open_connection(
-                host, 443,
-                ssl=context,
+                host, parsed.port or 443,
+                ssl=self._cert_ssl_context,
                 server_hostname=host
             )
             
-            cert = writer.get_extra_info('peercert')
-            writer.close()
-            await writer.wait_closed()
-            
-            if cert:
-                return {
-                    'issuer': dict(x[0] for x in cert['issuer']),
-                    'subject': dict(x[0] for x in cert['subject']),
-                    'version': cert['version'],
-                    'expires': cert['notAfter'],
-                    'serial_number': cert['serialNumber']
-                }
-            return None
-            
+            try:
+                return self._get_cert_info(writer.get_extra_info('ssl_object'))
+            finally:
+                writer.close()
+                await writer.wait_closed()
+        
         except Exception as e:
             self.logger.error(f"Error getting SSL info for {url}: {str(e)}")
             return None
     
     def _update_metrics(self, url: str, result: CheckResult):
         """Actualiza las métricas para una URL específica."""
-        if url not in self.metrics:
-            self.metrics[url] = {
-                'checks': 0,
-                'successful': 0,
-                'failed': 0,
-                'total_response_time': 0,
-                'min_response_time': float('inf'),
-                'max_response_time': 0,
-                'last_check': None,
-                'uptime_percentage': 100.0
-            }
-        
-        metrics = self.metrics[url]
-        metrics['checks'] += 1
-        metrics['last_check'] = datetime.now()
-        
-        if result.status_code == 200:
-            metrics['successful'] += 1
-        else:
-            metrics['failed'] += 1
+        metrics = self.metrics
+        i = metrics.index(url)
+        ok = int(result.status_code == 200)
         
-        if result.response_time > 0:
-            metrics['total_response_time'] += result.response_time
-            metrics['min_response_time'] = min(metrics['min_response_time'], result.response_time)
-            metrics['max_response_time'] = max(metrics['max_response_time'], result.response_time)
+        metrics.checks[i] += 1
+        metrics.successful[i] += ok
+        metrics.failed[i] += 1 - ok
+        metrics.last_check[i] = datetime.now()
         
-        metrics['uptime_percentage'] = (metrics['successful'] / metrics['checks']) * 100
+        rt = result.response_time
+        if rt > 0:
+            metrics.total_response_time[i] += rt
+            if rt < metrics.min_response_time[i]:
+                metrics.min_response_time[i] = rt
+            if rt > metrics.max_response_time[i]:
+                metrics.max_response_time[i] = rt
     
     def _record_check(self, url: str, result: CheckResult):
         """Registra una verificación en el historial."""
-        if url not in self._history:
-            self._history[url] = []
-        
-        self._history[url].append({
-            'timestamp': datetime.now(),
-            'status_code': result.status_code,
-            'response_time': result.response_time,
-            'error': result.error
-        })
+        history = self._history.get(url)
+        if history is None:
+            history = self._history[url] = HistoryBuffer(MAX_HISTORY_PER_URL)
         
-        # Mantener solo los últimos 1000 registros por URL
-        if len(self._history[url]) > 1000:
-            self._history[url] = self._history[url][-1000:]
+        # El historial descarta automáticamente los registros más antiguos
+        history.append(datetime.now(), result.status_code, result.response_time, result.error)
     
     def get_statistics(self, url: str) -> Dict:
         """
@@ -277,7 +559,7 @@ class WebsiteChecker:
         
         Args:
             url (str): URL del sitio web
-
+        
         Returns:
             Dict: Estadísticas detalladas
         """
@@ -310,7 +592,7 @@ class WebsiteChecker:
         Args:
             url (str): URL del sitio web
             days (Optional[int]): Número de días a considerar
-
+        
         Returns:
             List[dict]: Lista de verificaciones previas
         """
@@ -318,32 +600,48 @@ class WebsiteChecker:
             return []
         
         history = self._history[url]
+        if days is None:
+            return history.records()
+        
+        # Las marcas de tiempo están ordenadas: búsqueda binaria del corte
+        cutoff = datetime.now() - timedelta(days=days)
+        return history.records(history.index_since(cutoff))
+    
+    def get_history_buffer(self, url: str) -> Optional[HistoryBuffer]:
+        """
+        Obtiene el historial de una URL en forma de columnas NumPy.
         
-        if days is not None:
-            cutoff = datetime.now() - timedelta(days=days)
-            history = [
-                check for check in history
-                if check['timestamp'] >= cutoff
-            ]
+        Args:
+            url (str): URL del sitio web
         
-        return history
+        Returns:
+            Optional[HistoryBuffer]: Historial de la URL o None si no hay registros
+        """
+        return self._history.get(url)
     
-    def export_data(self, filename: str):
+    def export_data(self, filename: str, indent: bool = True):
         """
         Exporta todos los datos a un archivo JSON.
         
         Args:
             filename (str): Nombre del archivo de salida
+            indent (bool): Formatear el JSON con sangría
         """
         data = {
-            'history': self._history,
-            'metrics': self.metrics,
+            'history': {url: list(checks) for url, checks in self._history.items()},
+            'metrics': dict(self.metrics),
             'export_date': datetime.now().isoformat()
         }
         
         try:
-            with open(filename, 'w') as f:
-                json.dump(data, f, default=str, indent=2)
+            if orjson is not None:
+                # orjson serializa datetime de forma nativa
+                option = orjson.OPT_INDENT_2 if indent else 0
+                with open(filename, 'wb') as f:
+                    f.write(orjson.dumps(data, option=option))
+            else:
+                with open(filename, 'w') as f:
+                    json.dump(data, f, default=str, indent=2 if indent else None)
         except Exception as e:
             self.logger.error(f"Error exporting data: {str(e)}")
             raise
@@ -356,23 +654,25 @@ class WebsiteChecker:
             filename (str): Nombre del archivo a importar
         """
         try:
-            with open(filename, 'r') as f:
-                data = json.load(f)
-                
-            self._history = data['history']
-            self.metrics = data['metrics']
+            with open(filename, 'rb') as f:
+                data = orjson.loads(f.read()) if orjson is not None else json.load(f)
             
             # Convertir strings de fecha a objetos datetime
-            for url in self._history:
-                for check in self._history[url]:
+            for checks in data['history'].values():
+                for check in checks:
                     check['timestamp'] = datetime.fromisoformat(check['timestamp'])
             
-            for url in self.metrics:
-                if self.metrics[url]['last_check']:
-                    self.metrics[url]['last_check'] = datetime.fromisoformat(
-                        self.metrics[url]['last_check']
-                    )
-                    
+            self._history = {
+                url: HistoryBuffer.from_checks(checks, MAX_HISTORY_PER_URL)
+                for url, checks in data['history'].items()
+            }
+            
+            self.metrics.clear()
+            for url, metrics in data['metrics'].items():
+                if metrics.get('last_check'):
+                    metrics['last_check'] = datetime.fromisoformat(metrics['last_check'])
+                self.metrics[url] = metrics
+        
         except Exception as e:
             self.logger.error(f"Error importing data: {str(e)}")
             raise
@@ -382,29 +682,47 @@ class WebsiteChecker:
         self._history.clear()
         self.metrics.clear()
         self._cache.clear()
+        self._cert_cache.clear()
+        self._host_cert_cache.clear()
         self.logger.info("History and metrics cleared")
-
+    
     async def bulk_check(self, urls: List[str]) -> Dict[str, CheckResult]:
         """
         Verifica múltiples URLs de forma asíncrona.
         
+        Todas las verificaciones se lanzan a la vez sobre las sesiones
+        compartidas (hasta max_concurrency simultáneas), por lo que el
+        tiempo total se aproxima al de la URL más lenta. Las URLs repetidas
+        se verifican una sola vez.
+        
         Args:
             urls (List[str]): Lista de URLs a verificar
-
+        
         Returns:
             Dict[str, CheckResult]: Resultados por URL
         """
-        tasks = [self.check_website_async(url) for url in urls]
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        unique_urls = list(dict.fromkeys(urls))
+        
+        async def guarded_check(url: str) -> CheckResult:
+            async with semaphore:
+                return await self.check_website_async(url)
+        
+        tasks = [guarded_check(url) for url in unique_urls]
         results = await asyncio.gather(*tasks, return_exceptions=True)
-        return dict(zip(urls, results))
-
+        return {
+            url: result if isinstance(result, CheckResult)
+            else CheckResult(status_code=-1, response_time=-1, error=str(result))
+            for url, result in zip(unique_urls, results)
+        }
+    
     def calculate_health_score(self, url: str) -> float:
         """
         Calcula un score de salud para el sitio web (0-100).
         
         Args:
             url (str): URL del sitio web
-
+        
         Returns:
             float: Score de salud
         """
@@ -413,11 +731,6 @@ class WebsiteChecker:
         
         metrics = self.metrics[url]
         
-        # Factores y sus pesos
-        uptime_weight = 0.4
-        response_time_weight = 0.3
-        success_rate_weight = 0.3
-        
         # Calcular score de uptime (40%)
         uptime_score = metrics['uptime_percentage']
         
@@ -426,4 +739,38 @@ class WebsiteChecker:
         response_time_score = max(0, 100 - (avg_response_time / 1000) * 100)
         
         # Calcular score de tasa de éxito (30%)
-        success_rate = (metrics['successful'] / metrics['checks']) * 100
\ No newline at end of file
+        success_rate = (metrics['successful'] / metrics['checks']) * 100
+        
+        return (
+            uptime_score * UPTIME_WEIGHT +
+            response_time_score * RESPONSE_TIME_WEIGHT +
+            success_rate * SUCCESS_RATE_WEIGHT
+        )
+    
+    def calculate_health_scores(self) -> Dict[str, float]:
+        """
+        Calcula el score de salud de todas las URLs registradas en una sola pasada.
+        
+        Equivale a llamar a calculate_health_score por cada URL, pero opera
+        directamente sobre las columnas de métricas con NumPy.
+        
+        Returns:
+            Dict[str, float]: Score de salud por URL
+        """
+        n = len(self.metrics)
+        checks = self.metrics.checks[:n]
+        
+        # Las URLs sin verificaciones obtienen score 0
+        with np.errstate(divide='ignore', invalid='ignore'):
+            success_rate = np.where(checks > 0, self.metrics.successful[:n] / checks * 100, 0.0)
+            avg_response_time = np.where(checks > 0, self.metrics.total_response_time[:n] / checks, 0.0)
+        response_time_score = np.maximum(0, 100 - avg_response_time / 10)
+        
+        scores = (
+            success_rate * UPTIME_WEIGHT +
+            response_time_score * RESPONSE_TIME_WEIGHT +
+            success_rate * SUCCESS_RATE_WEIGHT
+        )
+        scores[checks == 0] = 0.0
+        
+        return dict(zip(self.metrics, scores.tolist()))
\ No newline at end of file
@@ -0,0 +1,154 @@
+"""
+History Buffer
+-------------
+Almacena el historial de verificaciones de una URL en arrays NumPy paralelos.
+"""
+
+from collections import deque
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Deque, Iterable, List, Optional
+
+import numpy as np
+
+class HistoryBuffer(Sequence):
+    """
+    Historial acotado de verificaciones con disposición por columnas.
+    
+    Cada campo se guarda en su propia array (marca de tiempo, código de
+    estado y tiempo de respuesta), de modo que los informes trabajan con
+    vistas de las arrays sin recorrer diccionarios. Las arrays reservan el
+    doble del máximo de registros: al llenarse se copian al principio los
+    más recientes, por lo que la ventana válida es siempre contigua.
+    Para compatibilidad, cada registro se puede leer como diccionario.
+    """
+    
+    def __init__(self, maxlen: int, capacity: int = 16):
+        """
+        Inicializa el historial vacío.
+        
+        Args:
+            maxlen (int): Número máximo de registros conservados
+            capacity (int): Número de registros reservados inicialmente
+        """
+        self.maxlen = maxlen
+        self._start = 0
+        self._end = 0
+        self._errors: Deque[Optional[str]] = deque(maxlen=maxlen)
+        self._allocate(min(capacity, 2 * maxlen))
+    
+    def _allocate(self, capacity: int):
+        """Reserva las arrays con la capacidad indicada, conservando los registros actuales."""
+        n = len(self)
+        timestamps = np.empty(capacity, dtype='datetime64[ns]')
+        status_codes = np.empty(capacity, dtype=np.int16)
+        response_ms = np.empty(capacity, dtype=np.float32)
+        
+        if n:
+            timestamps[:n] = self.timestamps
+            status_codes[:n] = self.status_codes
+            response_ms[:n] = self.response_ms
+        
+        self._timestamps = timestamps
+        self._status_codes = status_codes
+        self._response_ms = response_ms
+        self._start, self._end = 0, n
+    
+    @property
+    def timestamps(self) -> np.ndarray:
+        """Marcas de tiempo de los registros (vista, del más antiguo al más reciente)."""
+        return self._timestamps[self._start:self._end]
+    
+    @property
+    def status_codes(self) -> np.ndarray:
+        """Códigos de estado HTTP de los registros (vista)."""
+        return self._status_codes[self._start:self._end]
+    
+    @property
+    def response_ms(self) -> np.ndarray:
+        """Tiempos de respuesta en milisegundos (vista; -1 si la verificación falló)."""
+        return self._response_ms[self._start:self._end]
+    
+    @property
+    def errors(self) -> Deque[Optional[str]]:
+        """Mensajes de error de los registros."""
+        return self._errors
+    
+    def append(self, timestamp: datetime, status_code: int, response_ms: float,
+               error: Optional[str] = None):
+        """
+        Agrega un registro, descartando el más antiguo si se supera maxlen.
+        
+        Args:
+            timestamp (datetime): Momento de la verificación
+            status_code (int): Código de estado HTTP
+            response_ms (float): Tiempo de respuesta en milisegundos
+            error (Optional[str]): Mensaje de error, si lo hubo
+        """
+        if len(self) == self.maxlen:
+            # El deque de errores descarta el suyo automáticamente
+            self._start += 1
+        
+        if self._end == len(self._timestamps):
+            # Duplicar hasta 2 * maxlen; a partir de ahí solo compactar
+            self._allocate(min(max(1, 2 * len(self._timestamps)), 2 * self.maxlen))
+        
+        i = self._end
+        self._timestamps[i] = timestamp
+        self._status_codes[i] = status_code
+        self._response_ms[i] = response_ms
+        self._errors.append(error)
+        self._end += 1
+    
+    @classmethod
+    def from_checks(cls, checks: Iterable[dict], maxlen: int) -> 'HistoryBuffer':
+        """
+        Crea un historial a partir de registros en forma de diccionario.
+        
+        Args:
+            checks (Iterable[dict]): Registros con timestamp, status_code,
+                response_time y error
+            maxlen (int): Número máximo de registros conservados
+        
+        Returns:
+            HistoryBuffer: Historial con los registros indicados
+        """
+        buffer = cls(maxlen)
+        for check in checks:
+            buffer.append(
+                check['timestamp'],
+                check.get('status_code', 0),
+                check.get('response_time', -1),
+                check.get('error')
+            )
+        return buffer
+    
+    def index_since(self, cutoff: datetime) -> int:
+        """Devuelve la posición del primer registro posterior o igual a cutoff."""
+        return int(self.timestamps.searchsorted(np.datetime64(cutoff, 'ns')))
+    
+    def records(self, start: int = 0) -> List[dict]:
+        """Devuelve los registros desde la posición start como diccionarios."""
+        return [self[i] for i in range(start, len(self))]
+    
+    def __len__(self) -> int:
+        return self._end - self._start
+    
+    def __getitem__(self, index):
+        """Devuelve el registro en la posición indicada como diccionario."""
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        
+        n = len(self)
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError('history index out of range')
+        
+        i = self._start + index
+        return {
+            'timestamp': self._timestamps[i].astype('datetime64[us]').item(),
+            'status_code': int(self._status_codes[i]),
+            'response_time': float(self._response_ms[i]),
+            'error': self._errors[index]
+        }
\ No newline at end of file
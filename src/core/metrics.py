@@ -0,0 +1,152 @@
+"""
+Metrics Store
+------------
+Almacena las métricas de verificación por URL en arrays NumPy paralelos.
+"""
+
+from collections.abc import MutableMapping
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional
+
+import numpy as np
+
+class MetricsStore(MutableMapping):
+    """
+    Almacén de métricas con disposición por columnas (una array por campo).
+    
+    Cada URL ocupa una fila identificada por su índice, de modo que
+    actualizar una métrica es una asignación indexada y los cálculos
+    sobre todas las URLs se pueden vectorizar. Para compatibilidad se
+    comporta como un diccionario ``url -> dict`` con los mismos campos
+    que antes se guardaban por URL.
+    """
+    
+    def __init__(self, capacity: int = 16):
+        """
+        Inicializa el almacén vacío.
+        
+        Args:
+            capacity (int): Número de filas reservadas inicialmente
+        """
+        self._index: Dict[str, int] = {}
+        self._urls: List[str] = []
+        self.last_check: List[Optional[datetime]] = []
+        self._allocate(capacity)
+    
+    def _allocate(self, capacity: int):
+        """Reserva las arrays con la capacidad indicada, conservando los datos actuales."""
+        n = len(self._urls)
+        old = getattr(self, 'checks', None)
+        
+        checks = np.zeros(capacity, dtype=np.int64)
+        successful = np.zeros(capacity, dtype=np.int64)
+        failed = np.zeros(capacity, dtype=np.int64)
+        total_response_time = np.zeros(capacity, dtype=np.float64)
+        min_response_time = np.full(capacity, np.inf, dtype=np.float64)
+        max_response_time = np.zeros(capacity, dtype=np.float64)
+        
+        if old is not None:
+            checks[:n] = self.checks[:n]
+            successful[:n] = self.successful[:n]
+            failed[:n] = self.failed[:n]
+            total_response_time[:n] = self.total_response_time[:n]
+            min_response_time[:n] = self.min_response_time[:n]
+            max_response_time[:n] = self.max_response_time[:n]
+        
+        self.checks = checks
+        self.successful = successful
+        self.failed = failed
+        self.total_response_time = total_response_time
+        self.min_response_time = min_response_time
+        self.max_response_time = max_response_time
+    
+    def index(self, url: str) -> int:
+        """
+        Obtiene la fila asignada a una URL, creándola si no existe.
+        
+        Args:
+            url (str): URL del sitio web
+        
+        Returns:
+            int: Índice de la fila de la URL
+        """
+        i = self._index.get(url)
+        if i is None:
+            i = len(self._urls)
+            if i == len(self.checks):
+                self._allocate(max(1, 2 * i))
+            self._index[url] = i
+            self._urls.append(url)
+            self.last_check.append(None)
+        return i
+    
+    def __len__(self) -> int:
+        return len(self._urls)
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._urls))
+    
+    def __contains__(self, url) -> bool:
+        return url in self._index
+    
+    def __getitem__(self, url: str) -> dict:
+        """Devuelve una copia de las métricas de la URL como diccionario."""
+        i = self._index[url]
+        checks = int(self.checks[i])
+        successful = int(self.successful[i])
+        return {
+            'checks': checks,
+            'successful': successful,
+            'failed': int(self.failed[i]),
+            'total_response_time': float(self.total_response_time[i]),
+            'min_response_time': float(self.min_response_time[i]),
+            'max_response_time': float(self.max_response_time[i]),
+            'last_check': self.last_check[i],
+            'uptime_percentage': (successful / checks) * 100 if checks else 100.0
+        }
+    
+    def __setitem__(self, url: str, metrics: dict):
+        """Reemplaza las métricas de la URL a partir de un diccionario."""
+        def value(key, default):
+            v = metrics.get(key)
+            return default if v is None else v
+        
+        i = self.index(url)
+        self.checks[i] = value('checks', 0)
+        self.successful[i] = value('successful', 0)
+        self.failed[i] = value('failed', 0)
+        self.total_response_time[i] = value('total_response_time', 0)
+        self.min_response_time[i] = value('min_response_time', np.inf)
+        self.max_response_time[i] = value('max_response_time', 0)
+        self.last_check[i] = metrics.get('last_check')
+    
+    def __delitem__(self, url: str):
+        """Elimina una URL moviendo la última fila a su posición."""
+        i = self._index.pop(url)
+        last = len(self._urls) - 1
+        if i != last:
+            moved = self._urls[last]
+            self._urls[i] = moved
+            self._index[moved] = i
+            self.last_check[i] = self.last_check[last]
+            for column in (self.checks, self.successful, self.failed,
+                           self.total_response_time, self.min_response_time,
+                           self.max_response_time):
+                column[i] = column[last]
+        self._urls.pop()
+        self.last_check.pop()
+        
+        # Restablecer la fila liberada a sus valores iniciales
+        self.checks[last] = 0
+        self.successful[last] = 0
+        self.failed[last] = 0
+        self.total_response_time[last] = 0
+        self.min_response_time[last] = np.inf
+        self.max_response_time[last] = 0
+    
+    def clear(self):
+        """Elimina todas las métricas."""
+        self._index.clear()
+        self._urls.clear()
+        self.last_check.clear()
+        self._allocate(len(self.checks))
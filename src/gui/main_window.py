@@ -6,13 +6,173 @@ Implementa la interfaz gráfica principal de Website Checker.
 
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
+import bisect
+from collections import Counter, OrderedDict
 import json
-from typing import Callable, Optional
+import os
+import sys
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Set
 from datetime import datetime
+from dataclasses import dataclass
 import webbrowser
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import csv
+import numpy as np
+from concurrent.futures import Future, ThreadPoolExecutor
+
+# Alto por defecto (en píxeles) de una fila del Treeview
+DEFAULT_ROW_HEIGHT = 20
+
+# Filas desplazadas por cada paso de la rueda del ratón en el historial
+WHEEL_SCROLL_ROWS = 3
+
+# Estado mostrado para los sitios que responden correctamente
+STATUS_OK = "Disponible"
+
+# Campos de cada entrada del historial exportada a JSON
+EXPORT_FIELDS = ('url', 'status', 'response_time', 'timestamp')
+
+# Registro del historial de URLs (una por línea) y archivo JSON anterior
+URL_HISTORY_FILE = 'url_history.log'
+LEGACY_URL_HISTORY_FILE = 'url_history.json'
+
+# Resultados de validación de las URLs del historial (entre ejecuciones)
+VALIDATOR_CACHE_FILE = 'validator_cache.json'
+
+# Retardo (ms) antes de escribir las URLs pendientes en el registro
+URL_HISTORY_SAVE_DELAY = 2000
+
+# Número de líneas añadidas al registro tras el que se compacta
+URL_HISTORY_COMPACT_EVERY = 200
+
+# Número máximo de URLs recordadas (se descartan las menos recientes)
+MAX_URL_HISTORY = 500
+
+# Intervalo de auto-refresh (minutos): valor inicial y máximo (un día)
+DEFAULT_REFRESH_INTERVAL = 5
+MAX_REFRESH_INTERVAL = 1440
+
+# Tiempo (ms) sin cambios en la URL antes de lanzar una verificación automática
+URL_EDIT_DEBOUNCE = 250
+
+# Temas ttk de la aplicación
+LIGHT_THEME = 'webchecker_light'
+DARK_THEME = 'webchecker_dark'
+DARK_BACKGROUND = '#2b2b2b'
+
+# Estilos propios, comunes a ambos temas
+BASE_STYLE_SETTINGS = {
+    'Header.TLabel': {'configure': {'font': ('Helvetica', 12, 'bold')}},
+    'Status.TLabel': {'configure': {'font': ('Helvetica', 10)}},
+    'URL.TCombobox': {'configure': {'font': ('Helvetica', 10)}},
+}
+
+# Colores del tema oscuro
+DARK_STYLE_SETTINGS = {
+    '.': {'configure': {'background': DARK_BACKGROUND, 'foreground': 'white'}},
+    'TLabel': {'configure': {'background': DARK_BACKGROUND, 'foreground': 'white'}},
+    'TFrame': {'configure': {'background': DARK_BACKGROUND}},
+    'TLabelframe': {'configure': {'background': DARK_BACKGROUND}},
+    'TLabelframe.Label': {'configure': {'background': DARK_BACKGROUND, 'foreground': 'white'}},
+    'Treeview': {'configure': {
+        'background': '#3b3b3b', 'foreground': 'white', 'fieldbackground': '#3b3b3b'
+    }},
+}
+
+# Capacidad inicial de las arrays numéricas del historial
+INITIAL_HISTORY_CAPACITY = 256
+
+# Procedimiento Tcl que inserta al final del Treeview una lista de pares
+# (iid, valores) en una sola llamada desde Python
+BULK_INSERT_SCRIPT = (
+    '{tree rows} {foreach {iid values} $rows '
+    '{$tree insert {} end -id $iid -values $values}}'
+)
+
+# Script Tcl que inserta una URL en los valores del combobox y, si se
+# indica una posición (drop >= 0), descarta la URL que ocupa esa posición
+COMBO_UPDATE_SCRIPT = (
+    '{combo index url drop} {'
+    'set values [linsert [$combo cget -values] $index $url]; '
+    'if {$drop >= 0} {set values [lreplace $values $drop $drop]}; '
+    '$combo configure -values $values}'
+)
+
+# Puntos dibujados por píxel de ancho en el gráfico de tiempos de respuesta
+POINTS_PER_PIXEL = 2
+
+def _lttb(xs: np.ndarray, ys: np.ndarray, threshold: int) -> np.ndarray:
+    """
+    Reduce una serie con el algoritmo Largest-Triangle-Three-Buckets.
+    
+    Conserva el primer y el último punto y, de cada uno de los
+    threshold - 2 grupos intermedios, el punto que forma el triángulo de
+    mayor área con el punto elegido anterior y la media del grupo siguiente.
+    
+    Args:
+        xs (np.ndarray): Coordenadas x, en orden creciente
+        ys (np.ndarray): Coordenadas y
+        threshold (int): Número máximo de puntos a conservar
+    
+    Returns:
+        np.ndarray: Índices de los puntos seleccionados
+    """
+    n = len(xs)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+    
+    xs = np.asarray(xs, dtype=np.float64)
+    ys = np.asarray(ys, dtype=np.float64)
+    
+    # Límites de los grupos de puntos intermedios [1, n - 1)
+    edges = np.linspace(1, n - 1, threshold - 1).astype(np.intp)
+    
+    selected = np.empty(threshold, dtype=np.intp)
+    selected[0] = 0
+    selected[-1] = n - 1
+    
+    a = 0
+    for i in range(threshold - 2):
+        start, end = edges[i], edges[i + 1]
+        
+        # Media del grupo siguiente (el último punto para el último grupo)
+        if i + 2 < len(edges):
+            next_start, next_end = edges[i + 1], edges[i + 2]
+        else:
+            next_start, next_end = n - 1, n
+        avg_x = xs[next_start:next_end].mean()
+        avg_y = ys[next_start:next_end].mean()
+        
+        area = np.abs(
+            (xs[a] - avg_x) * (ys[start:end] - ys[a])
+            - (xs[a] - xs[start:end]) * (avg_y - ys[a])
+        )
+        a = start + int(np.argmax(area))
+        selected[i + 1] = a
+    
+    return selected
+
+@dataclass
+class HistoryRow:
+    """Entrada del historial de verificaciones mostrado en la interfaz."""
+    url: str
+    status: str
+    response_time: float
+    timestamp: datetime
+    
+    @property
+    def display_ts(self) -> str:
+        """Fecha/hora de la verificación con el formato mostrado."""
+        return self.timestamp.strftime("%Y-%m-%d %H:%M:%S")
+    
+    def as_tuple(self) -> tuple:
+        """Devuelve los valores tal como se muestran en el historial."""
+        response_time = f"{self.response_time:.2f}ms" if self.response_time > 0 else "N/A"
+        return (self.url, self.status, response_time, self.display_ts)
+    
+    def as_dict(self) -> dict:
+        """Devuelve la entrada como diccionario, con los valores mostrados."""
+        return dict(zip(EXPORT_FIELDS, self.as_tuple()))
 
 class MainWindow(ttk.Frame):
     """Ventana principal de la aplicación Website Checker."""
@@ -31,14 +191,28 @@ class MainWindow(ttk.Frame):
         self.checker = checker
         self.validator = validator
         
+        # Historial de verificaciones (fuente de datos del Treeview, en orden cronológico)
+        self._history_rows: List[HistoryRow] = []
+        self._view_start = 0
+        
+        # Columnas numéricas paralelas a self._history_rows para los gráficos
+        self._rt_array = np.empty(INITIAL_HISTORY_CAPACITY, dtype=np.float32)
+        self._ts_array = np.empty(INITIAL_HISTORY_CAPACITY, dtype='datetime64[us]')
+        self._ok_array = np.empty(INITIAL_HISTORY_CAPACITY, dtype=bool)
+        
         # Variables de control
         self.url_var = tk.StringVar()
         self.status_var = tk.StringVar(value="Estado: Esperando URL...")
         self.auto_refresh_var = tk.BooleanVar(value=False)
-        self.refresh_interval_var = tk.StringVar(value="5")
+        self.refresh_interval_var = tk.IntVar(value=DEFAULT_REFRESH_INTERVAL)
+        self._refresh_interval = DEFAULT_REFRESH_INTERVAL
+        self.refresh_interval_var.trace_add('write', self._on_interval_changed)
         self.dark_mode_var = tk.BooleanVar(value=False)
         self.show_details_var = tk.BooleanVar(value=True)
         
+        # Últimos valores asignados a las variables de texto
+        self._last_details: Dict[str, str] = {}
+        
         # Configurar estilo
         self.style = ttk.Style()
         self._setup_styles()
@@ -51,27 +225,85 @@ class MainWindow(ttk.Frame):
         self._setup_bindings()
         
         # Historial de URLs
-        self.url_history = set()
+        self.url_history: OrderedDict = OrderedDict()
+        self._url_history_sorted: List[str] = []
+        self._pending_urls: List[str] = []
+        self._log_appends = 0
+        self._history_dirty = False
+        self._save_job = None
+        self._history_lock = threading.Lock()
         self.load_url_history()
+        self.validator.load_cache(VALIDATOR_CACHE_FILE)
         
         # Variable para el job de auto-refresh
         self._refresh_job = None
+        
+        # Verificaciones en curso y última edición de la URL (reloj monotónico)
+        self._inflight = 0
+        self._last_url_edit = 0.0
+        self.url_var.trace_add('write', self._on_url_edited)
+        
+        # Pool de hilos para las verificaciones (evita bloquear la interfaz)
+        # y tareas enviadas que aún no han terminado
+        self._pool = ThreadPoolExecutor(max_workers=4)
+        self._pending: Set[Future] = set()
+        
+        # Gráficos abiertos: tipo -> (ventana, figura, ejes, canvas, artista)
+        self._chart_cache: Dict[str, tuple] = {}
     
     def _setup_styles(self):
-        """Configura los estilos de la aplicación."""
-        self.style.configure('Header.TLabel', font=('Helvetica', 12, 'bold'))
-        self.style.configure('Status.TLabel', font=('Helvetica', 10))
-        self.style.configure('URL.TCombobox', font=('Helvetica', 10))
+        """
+        Configura los estilos de la aplicación.
+        
+        Registra una sola vez los temas claro y oscuro para que cambiar de
+        tema sea un único theme_use en lugar de reconfigurar cada estilo.
+        """
+        self._light_background = self.master.cget('bg')
+        
+        themes = self.style.theme_names()
+        if LIGHT_THEME not in themes:
+            self.style.theme_create(
+                LIGHT_THEME,
+                parent=self.style.theme_use(),
+                settings=BASE_STYLE_SETTINGS
+            )
+        if DARK_THEME not in themes:
+            self.style.theme_create(
+                DARK_THEME,
+                parent='clam',
+                settings={**BASE_STYLE_SETTINGS, **DARK_STYLE_SETTINGS}
+            )
+        
+        self.style.theme_use(LIGHT_THEME)
+        self._current_theme = LIGHT_THEME
     
     def _setup_bindings(self):
         """Configura los bindings de eventos."""
         self.master.bind('<Return>', lambda e: self._check_website())
         self.master.protocol("WM_DELETE_WINDOW", self._on_closing)
     
+    def _submit(self, fn: Callable, *args) -> Future:
+        """Envía una tarea al pool de hilos, registrándola hasta que termine."""
+        future = self._pool.submit(fn, *args)
+        self._pending.add(future)
+        future.add_done_callback(self._pending.discard)
+        return future
+    
     def _on_closing(self):
         """Maneja el evento de cierre de la ventana."""
-        if self._refresh_job:
-            self.master.after_cancel(self._refresh_job)
+        self._cancel_refresh()
+        if sys.version_info >= (3, 9):
+            self._pool.shutdown(wait=False, cancel_futures=True)
+        else:
+            # cancel_futures no existe en Python 3.8: cancelar a mano las
+            # tareas que aún no han empezado
+            for future in list(self._pending):
+                future.cancel()
+            self._pool.shutdown(wait=False)
+        
+        # Guardar los cambios pendientes antes de salir
+        self._flush_url_history(background=False, compact=True)
+        self.validator.save_cache(VALIDATOR_CACHE_FILE, self.url_history)
         self.master.destroy()
     
     def _init_ui(self):
@@ -196,17 +428,25 @@ class MainWindow(ttk.Frame):
         self.history_tree.column("response_time", width=100)
         self.history_tree.column("timestamp", width=100)
         
-        # Scrollbar
-        scrollbar = ttk.Scrollbar(
+        # Scrollbar: el Treeview solo contiene las filas visibles, por lo que
+        # el desplazamiento se calcula sobre el modelo completo
+        self.history_scrollbar = ttk.Scrollbar(
             history_frame,
             orient=tk.VERTICAL,
-            command=self.history_tree.yview
+            command=self._on_history_scroll
         )
-        self.history_tree.configure(yscrollcommand=scrollbar.set)
         
         # Colocar elementos
         self.history_tree.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
-        scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
+        self.history_scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
+        
+        # Volver a dibujar la ventana visible al cambiar el tamaño
+        self.history_tree.bind('<Configure>', lambda e: self._render_history())
+        
+        # La rueda del ratón desplaza el modelo, no el contenido del Treeview
+        self.history_tree.bind('<MouseWheel>', self._on_history_wheel)
+        self.history_tree.bind('<Button-4>', self._on_history_wheel)
+        self.history_tree.bind('<Button-5>', self._on_history_wheel)
         
         # Menú contextual
         self._create_context_menu()
@@ -232,9 +472,13 @@ class MainWindow(ttk.Frame):
             text="Intervalo (min):"
         ).pack(side=tk.LEFT, padx=5)
         
-        ttk.Entry(
+        ttk.Spinbox(
             refresh_frame,
+            from_=1,
+            to=MAX_REFRESH_INTERVAL,
             textvariable=self.refresh_interval_var,
+            validate='key',
+            validatecommand=(self.register(self._validate_interval), '%P'),
             width=5
         ).pack(side=tk.LEFT, padx=5)
         
@@ -293,7 +537,7 @@ class MainWindow(ttk.Frame):
         file_menu.add_separator()
         file_menu.add_command(label="Limpiar Historial", command=self._clear_history)
         file_menu.add_separator()
-        file_menu.add_command(label="Salir", command=self.master.quit)
+        file_menu.add_command(label="Salir", command=self._on_closing)
         
         # Menú Ver
         view_menu = tk.Menu(menubar, tearoff=0)
@@ -347,6 +591,8 @@ class MainWindow(ttk.Frame):
         url = self.url_var.get().strip()
         
         if not url:
+            # Mantener el auto-refresh aunque este ciclo no verifique nada
+            self._arm_refresh()
             messagebox.showwarning(
                 "URL vacía",
                 "Por favor, ingrese una URL para verificar."
@@ -354,24 +600,37 @@ class MainWindow(ttk.Frame):
             return
         
         if not self.validator.is_valid_url(url):
+            self._arm_refresh()
             messagebox.showerror(
                 "URL inválida",
                 "Por favor, ingrese una URL válida (ejemplo: https://www.ejemplo.com)"
             )
             return
         
+        self._set_status("Estado: Verificando...")
+        
+        # Ejecutar la verificación en segundo plano y procesar el resultado
+        # en el hilo de Tk
+        self._inflight += 1
+        future = self._submit(self.checker.check_website, url)
+        future.add_done_callback(
+            lambda f: self.master.after(0, self._on_check_done, url, f)
+        )
+        
+        # Una sola verificación automática pendiente, contando desde esta
+        self._arm_refresh()
+    
+    def _on_check_done(self, url: str, future: Future):
+        """Procesa el resultado de una verificación en el hilo de la interfaz."""
         try:
-            self.status_var.set("Estado: Verificando...")
-            self.master.update_idletasks()
-            
-            result = self.checker.check_website(url)
+            result = future.result()
             
             # Actualizar estado
             if result.status_code == 200:
-                self.status_var.set(f"Estado: Sitio web disponible (código {result.status_code})")
-                status = "Disponible"
+                self._set_status(f"Estado: Sitio web disponible (código {result.status_code})")
+                status = STATUS_OK
             else:
-                self.status_var.set(
+                self._set_status(
                     f"Estado: Sitio web no disponible (código {result.status_code})"
                 )
                 status = "No disponible"
@@ -383,92 +642,259 @@ class MainWindow(ttk.Frame):
             self._add_to_history(url, status, result)
             
             # Actualizar URL history
-            self.url_history.add(url)
-            self._update_url_combo()
-            self._save_url_history()
-            
+            self._remember_url(url)
+        
         except Exception as e:
             messagebox.showerror(
                 "Error",
                 f"Error al verificar el sitio: {str(e)}"
             )
-            self.status_var.set("Estado: Error al verificar el sitio")
+            self._set_status("Estado: Error al verificar el sitio")
+        finally:
+            self._inflight -= 1
+    
+    def _on_url_edited(self, *args):
+        """Registra el instante en que el usuario modificó la URL."""
+        self._last_url_edit = time.monotonic()
     
     def _clear_url(self):
         """Limpia el campo de URL."""
         self.url_var.set("")
-        
+    
     def _add_to_history(self, url: str, status: str, result):
         """Agrega una entrada al historial."""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        response_time = f"{result.response_time:.2f}ms" if result.response_time > 0 else "N/A"
-        
-        self.history_tree.insert(
-            "",
-            0,
-            values=(url, status, response_time, timestamp)
+        row = HistoryRow(
+            url=url,
+            status=status,
+            response_time=result.response_time,
+            timestamp=datetime.now()
         )
+        
+        n = len(self._history_rows)
+        if n == len(self._rt_array):
+            self._grow_history_arrays()
+        self._rt_array[n] = row.response_time
+        self._ts_array[n] = row.timestamp
+        self._ok_array[n] = row.status == STATUS_OK
+        self._history_rows.append(row)
+        
+        # Las entradas nuevas se muestran arriba: volver al inicio
+        self._render_history(0)
+    
+    def _grow_history_arrays(self):
+        """Duplica la capacidad de las arrays numéricas del historial."""
+        capacity = 2 * len(self._rt_array)
+        for name in ('_rt_array', '_ts_array', '_ok_array'):
+            old = getattr(self, name)
+            new = np.empty(capacity, dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, name, new)
+    
+    def _visible_history_rows(self) -> int:
+        """Calcula cuántas filas caben en el área visible del historial."""
+        row_height = self.style.lookup('Treeview', 'rowheight') or DEFAULT_ROW_HEIGHT
+        height = self.history_tree.winfo_height()
+        if height <= 1:
+            # El widget aún no se ha dibujado
+            return int(self.history_tree.cget('height'))
+        return max(1, height // int(row_height))
+    
+    def _render_history(self, start: Optional[int] = None):
+        """
+        Muestra en el Treeview solo las filas del historial visibles.
+        
+        Las filas se presentan de la más reciente a la más antigua y el iid
+        de cada elemento es su índice en self._history_rows.
+        
+        Args:
+            start: Primera fila a mostrar (por defecto, la actual)
+        """
+        total = len(self._history_rows)
+        visible = self._visible_history_rows()
+        
+        if start is None:
+            start = self._view_start
+        start = max(0, min(start, total - visible))
+        self._view_start = start
+        
+        items = []
+        for position in range(start, min(total, start + visible)):
+            index = total - 1 - position
+            items.append(str(index))
+            items.append(self._history_rows[index].as_tuple())
+        
+        # Conservar la selección si la fila sigue dentro de la ventana
+        selected = self.history_tree.selection()
+        
+        self.history_tree.delete(*self.history_tree.get_children())
+        self._bulk_insert(items)
+        
+        if selected and selected[0] in items[::2]:
+            self.history_tree.selection_set(selected[0])
+        
+        if total:
+            self.history_scrollbar.set(start / total, min(1.0, (start + visible) / total))
+        else:
+            self.history_scrollbar.set(0.0, 1.0)
+    
+    def _bulk_insert(self, items: list):
+        """
+        Inserta varias filas en el Treeview con una sola llamada a Tcl.
+        
+        Args:
+            items (list): Pares consecutivos de iid y tupla de valores
+        """
+        if items:
+            self.history_tree.tk.call(
+                'apply', BULK_INSERT_SCRIPT, str(self.history_tree), tuple(items)
+            )
+    
+    def _on_history_scroll(self, *args):
+        """Desplaza la ventana visible del historial según la scrollbar."""
+        total = len(self._history_rows)
+        
+        if args[0] == 'moveto':
+            start = int(float(args[1]) * total)
+        elif args[0] == 'scroll':
+            step = int(args[1])
+            if args[2] == 'pages':
+                step *= self._visible_history_rows()
+            start = self._view_start + step
+        else:
+            return
+        
+        self._render_history(start)
+    
+    def _on_history_wheel(self, event):
+        """Desplaza el historial con la rueda del ratón."""
+        if event.num == 4 or event.delta > 0:
+            step = -WHEEL_SCROLL_ROWS
+        else:
+            step = WHEEL_SCROLL_ROWS
+        self._render_history(self._view_start + step)
+        return "break"
+    
+    def _selected_history_index(self) -> Optional[int]:
+        """Devuelve el índice en el historial de la fila seleccionada."""
+        selected = self.history_tree.selection()
+        if not selected:
+            return None
+        return int(selected[0])
     
     def _update_details(self, result):
         """Actualiza el panel de detalles con los resultados."""
-        self.details_vars['response_time'].set(f"{result.response_time:.2f}ms")
-        self.details_vars['content_type'].set(result.content_type or "N/A")
-        self.details_vars['server'].set(result.server or "N/A")
-        
         ssl_status = "Seguro (HTTPS)" if result.ssl_info else "No seguro (HTTP)"
-        self.details_vars['ssl_status'].set(ssl_status)
+        
+        details = {
+            'response_time': f"{result.response_time:.2f}ms",
+            'content_type': result.content_type or "N/A",
+            'server': result.server or "N/A",
+            'ssl_status': ssl_status
+        }
+        for key, value in details.items():
+            self._set_var(key, self.details_vars[key], value)
+    
+    def _set_status(self, text: str):
+        """Actualiza el texto de la barra de estado si ha cambiado."""
+        self._set_var('status', self.status_var, text)
+    
+    def _set_var(self, key: str, var: tk.StringVar, value: str):
+        """
+        Asigna un valor a una variable de Tk solo si es distinto del último.
+        
+        Evita disparar las trazas y el redibujado de los widgets cuando
+        el valor no cambia entre verificaciones.
+        
+        Args:
+            key (str): Clave del valor en la caché
+            var (tk.StringVar): Variable a actualizar
+            value (str): Nuevo valor
+        """
+        if self._last_details.get(key) != value:
+            var.set(value)
+            self._last_details[key] = value
     
     def _toggle_auto_refresh(self):
         """Activa/desactiva el auto-refresh."""
         if self.auto_refresh_var.get():
-            try:
-                interval = int(self.refresh_interval_var.get())
-                if interval < 1:
-                    raise ValueError("El intervalo debe ser mayor a 0")
-                self._schedule_refresh()
-            except ValueError as e:
-                messagebox.showerror(
-                    "Error",
-                    f"Intervalo inválido: {str(e)}"
-                )
-                self.auto_refresh_var.set(False)
+            self._schedule_refresh()
         else:
-            if hasattr(self, '_refresh_job'):
-                self.master.after_cancel(self._refresh_job)
+            self._cancel_refresh()
+    
+    def _validate_interval(self, text: str) -> bool:
+        """Acepta solo dígitos (o el campo vacío mientras se edita) en el intervalo."""
+        return text == '' or (text.isdigit() and int(text) <= MAX_REFRESH_INTERVAL)
+    
+    def _on_interval_changed(self, *args):
+        """Guarda el intervalo de auto-refresh cuando el usuario lo modifica."""
+        try:
+            interval = self.refresh_interval_var.get()
+        except tk.TclError:
+            # Campo vacío durante la edición: conservar el último valor
+            return
+        if interval >= 1:
+            self._refresh_interval = interval
     
     def _schedule_refresh(self):
-        """Programa la próxima actualización."""
+        """
+        Ejecuta la verificación automática (que programa la siguiente).
+        
+        Si la verificación anterior sigue en curso se omite este ciclo, y si
+        el usuario está escribiendo la URL se espera a que termine.
+        """
+        self._refresh_job = None
+        if not self.auto_refresh_var.get():
+            return
+        
+        if self._inflight:
+            self._arm_refresh()
+            return
+        
+        since_edit = (time.monotonic() - self._last_url_edit) * 1000
+        if since_edit < URL_EDIT_DEBOUNCE:
+            self._refresh_job = self.master.after(
+                int(URL_EDIT_DEBOUNCE - since_edit) + 1, self._schedule_refresh
+            )
+            return
+        
+        self._check_website()
+    
+    def _arm_refresh(self):
+        """Programa la próxima verificación automática si está activada."""
+        self._cancel_refresh()
         if self.auto_refresh_var.get():
-            interval = int(self.refresh_interval_var.get()) * 60 * 1000  # convertir a ms
-            self._check_website()
+            interval = self._refresh_interval * 60 * 1000  # convertir a ms
             self._refresh_job = self.master.after(interval, self._schedule_refresh)
     
+    def _cancel_refresh(self):
+        """Cancela la verificación automática pendiente, si la hay."""
+        if self._refresh_job is not None:
+            self.master.after_cancel(self._refresh_job)
+            self._refresh_job = None
+    
     def _toggle_theme(self):
         """Cambia entre tema claro y oscuro."""
         if self.dark_mode_var.get():
-            self._apply_dark_theme()
+            self._use_theme(DARK_THEME, DARK_BACKGROUND)
         else:
-            self._apply_light_theme()
-    
-    def _apply_dark_theme(self):
-        """Aplica el tema oscuro."""
-        self.style.configure('.', background='#2b2b2b', foreground='white')
-        self.style.configure('TLabel', background='#2b2b2b', foreground='white')
-        self.style.configure('TFrame', background='#2b2b2b')
-        self.style.configure('TLabelframe', background='#2b2b2b')
-        self.style.configure('TLabelframe.Label', background='#2b2b2b', foreground='white')
-        self.style.configure('Treeview', background='#3b3b3b', foreground='white', fieldbackground='#3b3b3b')
-        self.master.configure(bg='#2b2b2b')
-    
-    def _apply_light_theme(self):
-        """Aplica el tema claro."""
-        self.style.configure('.', background='system', foreground='system')
-        self.style.configure('TLabel', background='system', foreground='system')
-        self.style.configure('TFrame', background='system')
-        self.style.configure('TLabelframe', background='system')
-        self.style.configure('TLabelframe.Label', background='system', foreground='system')
-        self.style.configure('Treeview', background='system', foreground='system', fieldbackground='system')
-        self.master.configure(bg='system')
+            self._use_theme(LIGHT_THEME, self._light_background)
+    
+    def _use_theme(self, theme: str, background: str):
+        """
+        Activa un tema ttk y el fondo de la ventana principal.
+        
+        No hace nada si el tema ya está activo, evitando el redibujado
+        de todos los widgets que provoca theme_use.
+        
+        Args:
+            theme (str): Nombre del tema ttk
+            background (str): Color de fondo de la ventana principal
+        """
+        if theme == self._current_theme:
+            return
+        self._current_theme = theme
+        self.style.theme_use(theme)
+        self.master.configure(bg=background)
     
     def _toggle_details(self):
         """Muestra/oculta el panel de detalles."""
@@ -486,80 +912,184 @@ class MainWindow(ttk.Frame):
     
     def _copy_selected_url(self):
         """Copia la URL seleccionada al portapapeles."""
-        selected = self.history_tree.selection()
-        if not selected:
+        index = self._selected_history_index()
+        if index is None:
             return
-            
-        url = self.history_tree.item(selected[0])['values'][0]
+        
+        url = self._history_rows[index].url
         self.master.clipboard_clear()
         self.master.clipboard_append(url)
     
     def _recheck_selected(self):
         """Vuelve a verificar la URL seleccionada."""
-        selected = self.history_tree.selection()
-        if not selected:
+        index = self._selected_history_index()
+        if index is None:
             return
-            
-        url = self.history_tree.item(selected[0])['values'][0]
+        
+        url = self._history_rows[index].url
         self.url_var.set(url)
         self._check_website()
     
     def _delete_selected(self):
         """Elimina la entrada seleccionada del historial."""
-        selected = self.history_tree.selection()
-        if not selected:
+        index = self._selected_history_index()
+        if index is None:
             return
-            
-        self.history_tree.delete(selected[0])
+        
+        n = len(self._history_rows)
+        for array in (self._rt_array, self._ts_array, self._ok_array):
+            array[index:n - 1] = array[index + 1:n]
+        del self._history_rows[index]
+        
+        # Los índices posteriores se desplazan: no reseleccionar otra fila
+        self.history_tree.selection_remove(self.history_tree.selection())
+        self._render_history()
     
     def _show_chart(self, chart_type: str):
-        """Muestra un gráfico específico."""
+        """
+        Muestra un gráfico específico.
+        
+        La ventana, la figura y el canvas de cada tipo de gráfico se crean
+        una sola vez; al volver a abrirlo solo se actualizan los datos.
+        
+        Args:
+            chart_type (str): Tipo de gráfico ('response_time', 'status' o 'availability')
+        """
+        cached = self._chart_cache.get(chart_type)
+        if cached and cached[0].winfo_exists():
+            chart_window, fig, ax, canvas, artist = cached
+            chart_window.deiconify()
+            chart_window.lift()
+            
+            if artist is not None and chart_type == 'response_time':
+                artist = self._update_response_times(ax, artist)
+            else:
+                ax.clear()
+                artist = self._draw_chart(chart_type, ax)
+            
+            self._chart_cache[chart_type] = (chart_window, fig, ax, canvas, artist)
+            canvas.draw_idle()
+            return
+        
+        # Matplotlib se importa solo al abrir el primer gráfico
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        
         chart_window = tk.Toplevel(self.master)
         chart_window.title(f"Gráfico - {chart_type.replace('_', ' ').title()}")
         chart_window.geometry("800x600")
+        # Ocultar en lugar de destruir para reutilizar la figura
+        chart_window.protocol("WM_DELETE_WINDOW", chart_window.withdraw)
+        
+        # Figura independiente de pyplot; constrained_layout ajusta los márgenes
+        fig = Figure(figsize=(10, 6), layout='constrained')
+        ax = fig.add_subplot(111)
+        artist = self._draw_chart(chart_type, ax)
         
-        fig, ax = plt.subplots(figsize=(10, 6))
+        canvas = FigureCanvasTkAgg(fig, master=chart_window)
+        canvas.draw_idle()
+        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        
+        self._chart_cache[chart_type] = (chart_window, fig, ax, canvas, artist)
+    
+    def _draw_chart(self, chart_type: str, ax):
+        """
+        Dibuja desde cero el gráfico indicado en los ejes.
         
+        Returns:
+            El artista reutilizable del gráfico, o None si no lo hay
+        """
         if chart_type == 'response_time':
-            self._plot_response_times(ax)
+            return self._plot_response_times(ax)
         elif chart_type == 'status':
             self._plot_status_distribution(ax)
         elif chart_type == 'availability':
             self._plot_availability(ax)
+        return None
+    
+    def _response_time_data(self):
+        """
+        Devuelve los tiempos de respuesta válidos del historial.
         
-        canvas = FigureCanvasTkAgg(fig, master=chart_window)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        Returns:
+            tuple: (fechas en días de Matplotlib, tiempos de respuesta)
+        """
+        from matplotlib.dates import date2num
+        
+        n = len(self._history_rows)
+        times = self._rt_array[:n]
+        
+        # Omitir las verificaciones sin tiempo de respuesta
+        valid = times > 0
+        return date2num(self._ts_array[:n][valid]), times[valid]
+    
+    @staticmethod
+    def _downsample(ax, xs: np.ndarray, ys: np.ndarray):
+        """Reduce la serie a los puntos que caben en el ancho de los ejes."""
+        threshold = int(ax.bbox.width * POINTS_PER_PIXEL)
+        if len(xs) > threshold:
+            selected = _lttb(xs, ys, threshold)
+            return xs[selected], ys[selected]
+        return xs, ys
     
     def _plot_response_times(self, ax):
-        """Dibuja el gráfico de tiempos de respuesta."""
-        times = []
-        labels = []
-        
-        for item in self.history_tree.get_children():
-            values = self.history_tree.item(item)['values']
-            try:
-                response_time = float(values[2].replace('ms', ''))
-                times.append(response_time)
-                labels.append(values[3])  # timestamp
-            except (ValueError, AttributeError):
-                continue
-        
-        if times:
-            ax.plot(labels, times, marker='o')
+        """
+        Dibuja el gráfico de tiempos de respuesta.
+        
+        Las series largas se reducen con LTTB a un número de puntos acorde
+        al ancho del gráfico, y se vuelven a reducir sobre el rango visible
+        al hacer zoom.
+        
+        Returns:
+            Line2D: Línea dibujada, o None si no hay datos
+        """
+        dates, times = self._response_time_data()
+        
+        if len(times):
+            line, = ax.plot(*self._downsample(ax, dates, times), marker='o')
+            ax.xaxis_date()
+            ax.callbacks.connect(
+                'xlim_changed',
+                lambda ax: self._on_response_xlim_changed(ax, line)
+            )
             ax.set_xlabel('Fecha/Hora')
             ax.set_ylabel('Tiempo de Respuesta (ms)')
             ax.set_title('Tiempos de Respuesta')
-            plt.xticks(rotation=45)
-            plt.tight_layout()
+            ax.tick_params(axis='x', labelrotation=45)
+            return line
+        return None
+    
+    def _on_response_xlim_changed(self, ax, line):
+        """Vuelve a reducir la serie sobre el rango visible tras un zoom."""
+        dates, times = self._response_time_data()
+        low, high = ax.get_xlim()
+        
+        # Incluir un punto a cada lado para que la línea llegue a los bordes
+        start = max(0, np.searchsorted(dates, low) - 1)
+        end = np.searchsorted(dates, high, side='right') + 1
+        line.set_data(*self._downsample(ax, dates[start:end], times[start:end]))
+    
+    def _update_response_times(self, ax, line):
+        """
+        Actualiza la línea existente con los datos actuales del historial.
+        
+        Returns:
+            Line2D: Línea actualizada, o None si ya no hay datos
+        """
+        dates, times = self._response_time_data()
+        
+        if not len(times):
+            ax.clear()
+            return None
+        
+        line.set_data(*self._downsample(ax, dates, times))
+        ax.relim()
+        ax.autoscale_view()
+        return line
     
     def _plot_status_distribution(self, ax):
         """Dibuja el gráfico de distribución de estados."""
-        status_count = {}
-        
-        for item in self.history_tree.get_children():
-            status = self.history_tree.item(item)['values'][1]
-            status_count[status] = status_count.get(status, 0) + 1
+        status_count = Counter(row.status for row in self._history_rows)
         
         if status_count:
             statuses = list(status_count.keys())
@@ -569,18 +1099,11 @@ class MainWindow(ttk.Frame):
             ax.set_xlabel('Estado')
             ax.set_ylabel('Cantidad')
             ax.set_title('Distribución de Estados')
-            plt.tight_layout()
     
     def _plot_availability(self, ax):
         """Dibuja el gráfico de disponibilidad."""
-        available = 0
-        total = 0
-        
-        for item in self.history_tree.get_children():
-            status = self.history_tree.item(item)['values'][1]
-            total += 1
-            if status == "Disponible":
-                available += 1
+        total = len(self._history_rows)
+        available = np.count_nonzero(self._ok_array[:total])
         
         if total:
             availability = (available / total) * 100
@@ -593,7 +1116,6 @@ class MainWindow(ttk.Frame):
                 colors=['#2ecc71', '#e74c3c']
             )
             ax.set_title('Disponibilidad General')
-            plt.tight_layout()
     
     def _export_csv(self):
         """Exporta el historial a CSV."""
@@ -604,23 +1126,7 @@ class MainWindow(ttk.Frame):
         )
         
         if filename:
-            try:
-                with open(filename, 'w', newline='') as f:
-                    writer = csv.writer(f)
-                    writer.writerow(['URL', 'Estado', 'Tiempo de Respuesta', 'Fecha/Hora'])
-                    
-                    for item in self.history_tree.get_children():
-                        writer.writerow(self.history_tree.item(item)['values'])
-                        
-                messagebox.showinfo(
-                    "Éxito",
-                    f"Historial exportado exitosamente a {filename}"
-                )
-            except Exception as e:
-                messagebox.showerror(
-                    "Error",
-                    f"Error al exportar el historial: {str(e)}"
-                )
+            self._run_export(self._write_csv, filename)
     
     def _export_json(self):
         """Exporta el historial a JSON."""
@@ -631,29 +1137,54 @@ class MainWindow(ttk.Frame):
         )
         
         if filename:
-            try:
-                data = []
-                for item in self.history_tree.get_children():
-                    values = self.history_tree.item(item)['values']
-                    data.append({
-                        'url': values[0],
-                        'status': values[1],
-                        'response_time': values[2],
-                        'timestamp': values[3]
-                    })
-                
-                with open(filename, 'w') as f:
-                    json.dump(data, f, indent=2)
-                    
-                messagebox.showinfo(
-                    "Éxito",
-                    f"Historial exportado exitosamente a {filename}"
-                )
-            except Exception as e:
-                messagebox.showerror(
-                    "Error",
-                    f"Error al exportar el historial: {str(e)}"
-                )
+            self._run_export(self._write_json, filename)
+    
+    def _run_export(self, writer: Callable[[str, List[HistoryRow]], None], filename: str):
+        """
+        Escribe el historial en segundo plano y notifica el resultado.
+        
+        Args:
+            writer: Función que escribe las filas en el archivo
+            filename (str): Ruta del archivo de destino
+        """
+        # Copia de las filas (de la más reciente a la más antigua) tomada
+        # en el hilo de la interfaz para no leer el modelo mientras cambia
+        rows = self._history_rows[::-1]
+        
+        future = self._submit(writer, filename, rows)
+        future.add_done_callback(
+            lambda f: self.master.after(0, self._on_export_done, filename, f)
+        )
+    
+    def _on_export_done(self, filename: str, future: Future):
+        """Informa del resultado de una exportación en el hilo de la interfaz."""
+        try:
+            future.result()
+            messagebox.showinfo(
+                "Éxito",
+                f"Historial exportado exitosamente a {filename}"
+            )
+        except Exception as e:
+            messagebox.showerror(
+                "Error",
+                f"Error al exportar el historial: {str(e)}"
+            )
+    
+    @staticmethod
+    def _write_csv(filename: str, rows: List[HistoryRow]):
+        """Escribe las filas del historial en un archivo CSV."""
+        import csv
+        
+        with open(filename, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['URL', 'Estado', 'Tiempo de Respuesta', 'Fecha/Hora'])
+            writer.writerows(row.as_tuple() for row in rows)
+    
+    @staticmethod
+    def _write_json(filename: str, rows: List[HistoryRow]):
+        """Escribe las filas del historial en un archivo JSON."""
+        with open(filename, 'w') as f:
+            json.dump([row.as_dict() for row in rows], f, indent=2)
     
     def _clear_history(self):
         """Limpia el historial de verificaciones."""
@@ -661,9 +1192,9 @@ class MainWindow(ttk.Frame):
             "Confirmar",
             "¿Estás seguro de que deseas limpiar todo el historial?"
         ):
-            for item in self.history_tree.get_children():
-                self.history_tree.delete(item)
-                
+            self._history_rows.clear()
+            self._render_history(0)
+    
     def _show_settings(self):
         """Muestra la ventana de configuración."""
         settings_window = tk.Toplevel(self.master)
@@ -709,25 +1240,143 @@ class MainWindow(ttk.Frame):
         messagebox.showinfo("Acerca de Website Checker", about_text)
     
     def load_url_history(self):
-        """Carga el historial de URLs desde un archivo."""
+        """
+        Carga el historial de URLs desde su registro.
+        
+        Cada línea del registro es una verificación; las URLs repetidas se
+        reordenan para que la última aparición marque su uso más reciente.
+        Si el registro no existe se importa el archivo JSON anterior.
+        """
+        self.url_history = OrderedDict()
         try:
-            with open('url_history.json', 'r') as f:
-                self.url_history = set(json.load(f))
+            if os.path.exists(URL_HISTORY_FILE):
+                with open(URL_HISTORY_FILE, 'r') as f:
+                    urls = [line.strip() for line in f if line.strip()]
+            elif os.path.exists(LEGACY_URL_HISTORY_FILE):
+                with open(LEGACY_URL_HISTORY_FILE, 'r') as f:
+                    urls = json.load(f)
+            else:
+                return
+            
+            for url in urls:
+                self.url_history[url] = None
+                self.url_history.move_to_end(url)
+            while len(self.url_history) > MAX_URL_HISTORY:
+                self.url_history.popitem(last=False)
+            
+            # Las líneas sobrantes se eliminarán en la próxima compactación
+            self._log_appends = len(urls) - len(self.url_history)
+            if not os.path.exists(URL_HISTORY_FILE):
+                # Migrar el archivo JSON al registro en la próxima escritura
+                self._log_appends = URL_HISTORY_COMPACT_EVERY
+                self._history_dirty = True
             self._update_url_combo()
-        except FileNotFoundError:
-            self.url_history = set()
         except Exception as e:
             print(f"Error cargando historial de URLs: {e}")
-            self.url_history = set()
+            self.url_history = OrderedDict()
     
     def _update_url_combo(self):
         """Actualiza el combobox con el historial de URLs."""
-        self.url_combo['values'] = list(self.url_history)
+        self._url_history_sorted = sorted(self.url_history)
+        self.url_combo['values'] = self._url_history_sorted
+    
+    def _remember_url(self, url: str):
+        """
+        Registra el uso de una URL en el historial.
+        
+        El historial funciona como una caché LRU: una URL conocida pasa a
+        ser la más reciente y, al superar MAX_URL_HISTORY, se descarta la
+        menos usada. La lista ordenada se mantiene con búsqueda binaria y
+        al combobox solo se le envían los cambios (la URL nueva y la
+        descartada), sin volver a convertir la lista completa desde Python.
+        
+        Args:
+            url (str): URL verificada
+        """
+        if url in self.url_history:
+            self.url_history.move_to_end(url)
+        else:
+            self.url_history[url] = None
+            index = bisect.bisect_left(self._url_history_sorted, url)
+            self._url_history_sorted.insert(index, url)
+            
+            drop = -1
+            if len(self.url_history) > MAX_URL_HISTORY:
+                oldest, _ = self.url_history.popitem(last=False)
+                drop = bisect.bisect_left(self._url_history_sorted, oldest)
+                del self._url_history_sorted[drop]
+            
+            self.url_combo.tk.call(
+                'apply', COMBO_UPDATE_SCRIPT, str(self.url_combo), index, url, drop
+            )
+        
+        self._save_url_history(url)
+    
+    def _save_url_history(self, url: str):
+        """
+        Programa el guardado de una URL en el registro.
+        
+        Las URLs se acumulan y se añaden al registro como mucho una vez
+        cada URL_HISTORY_SAVE_DELAY milisegundos.
+        
+        Args:
+            url (str): URL a registrar
+        """
+        self._pending_urls.append(url)
+        self._history_dirty = True
+        if not self._save_job:
+            self._save_job = self.master.after(URL_HISTORY_SAVE_DELAY, self._flush_url_history)
+    
+    def _flush_url_history(self, background: bool = True, compact: bool = False):
+        """
+        Escribe en disco los cambios pendientes del historial de URLs.
+        
+        Normalmente solo se añaden las URLs pendientes al final del
+        registro; cada URL_HISTORY_COMPACT_EVERY líneas (o si se pide) el
+        registro se reescribe con una línea por URL.
+        
+        Args:
+            background (bool): Si es True la escritura se hace en el pool de hilos
+            compact (bool): Si es True se compacta el registro
+        """
+        if self._save_job:
+            self.master.after_cancel(self._save_job)
+            self._save_job = None
+        
+        if not self._history_dirty:
+            return
+        self._history_dirty = False
+        
+        urls, self._pending_urls = self._pending_urls, []
+        self._log_appends += len(urls)
+        
+        if compact or self._log_appends >= URL_HISTORY_COMPACT_EVERY:
+            self._log_appends = 0
+            write, urls = self._write_url_history, list(self.url_history)
+        else:
+            write = self._append_url_history
+        
+        if background:
+            self._submit(write, urls)
+        else:
+            write(urls)
+    
+    def _append_url_history(self, urls: List[str]):
+        """Añade URLs al final del registro del historial."""
+        try:
+            with self._history_lock:
+                with open(URL_HISTORY_FILE, 'a') as f:
+                    f.write(''.join(url + '\n' for url in urls))
+        except Exception as e:
+            print(f"Error guardando historial de URLs: {e}")
     
-    def _save_url_history(self):
-        """Guarda el historial de URLs en un archivo."""
+    def _write_url_history(self, urls: List[str]):
+        """Reescribe de forma atómica el registro con las URLs indicadas."""
+        tmp_file = URL_HISTORY_FILE + '.tmp'
         try:
-            with open('url_history.json', 'w') as f:
-                json.dump(list(self.url_history), f)
+            with self._history_lock:
+                with open(tmp_file, 'w') as f:
+                    f.write(''.join(url + '\n' for url in urls))
+                os.replace(tmp_file, URL_HISTORY_FILE)
         except Exception as e:
             print(f"Error guardando historial de URLs: {e}")
\ No newline at end of file
@@ -4,6 +4,6 @@ Utils Package
 Contiene utilidades y helpers para la aplicación Website Checker.
 """
 
-from .validators import URLValidator
+from .validators import DEFAULT_VALIDATOR, URLValidator
 
-__all__ = ['URLValidator']
\ No newline at end of file
+__all__ = ['URLValidator', 'DEFAULT_VALIDATOR']
\ No newline at end of file
@@ -1,32 +1,215 @@
 # Crear nuevo archivo: src/utils/reports.py
 
-import matplotlib.pyplot as plt
 from datetime import datetime, timedelta
 import json
-import pandas as pd
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba es opcional
+    njit = None
+
+def _uptime_loop(codes, rt, ts, start, end):
+    """
+    Calcula en una sola pasada las estadísticas de uptime de un periodo.
+    
+    Args:
+        codes: Códigos de estado HTTP (int16)
+        rt: Tiempos de respuesta en ms, -1 si la verificación falló (float32)
+        ts: Marcas de tiempo en nanosegundos (int64)
+        start: Inicio del periodo en nanosegundos
+        end: Fin del periodo en nanosegundos
+    
+    Returns:
+        tuple: (verificaciones, verificaciones correctas, tiempo medio en ms)
+    """
+    total = 0
+    ok = 0
+    timed = 0
+    s = 0.0
+    for i in range(ts.size):
+        if start <= ts[i] <= end:
+            total += 1
+            if codes[i] == 200:
+                ok += 1
+            # Las verificaciones fallidas no tienen tiempo de respuesta
+            if rt[i] >= 0:
+                timed += 1
+                s += rt[i]
+    return total, ok, (s / timed if timed else 0.0)
+
+def _uptime_numpy(codes, rt, ts, start, end):
+    """Versión vectorizada de _uptime_loop, usada cuando numba no está instalado."""
+    # El historial está ordenado por fecha: acotar el periodo con búsqueda binaria
+    lo = ts.searchsorted(start)
+    hi = ts.searchsorted(end, side='right')
+    
+    rt = rt[lo:hi]
+    rt = rt[rt >= 0]
+    return (
+        int(hi - lo),
+        int(np.count_nonzero(codes[lo:hi] == 200)),
+        float(rt.mean()) if len(rt) else 0.0
+    )
+
+def _minmax_indices(y: np.ndarray, target: int) -> np.ndarray:
+    """
+    Reduce una serie a los mínimos y máximos de cada tramo.
+    
+    Divide la serie en target // 2 tramos consecutivos y conserva la
+    posición del mínimo y del máximo de cada uno, de modo que los picos
+    siguen visibles. Los puntos sobrantes al final forman un último tramo.
+    
+    Args:
+        y: Valores de la serie
+        target: Número aproximado de puntos a conservar
+    
+    Returns:
+        np.ndarray: Índices ordenados de los puntos conservados
+    """
+    n = len(y)
+    buckets = max(1, target // 2)
+    size = n // buckets
+    if size < 2:
+        return np.arange(n)
+    
+    m = size * buckets
+    blocks = y[:m].reshape(buckets, size)
+    offsets = np.arange(0, m, size)
+    indices = [blocks.argmin(axis=1) + offsets, blocks.argmax(axis=1) + offsets]
+    
+    if m < n:
+        tail = y[m:]
+        indices.append(np.array([m + tail.argmin(), m + tail.argmax()]))
+    
+    return np.unique(np.concatenate(indices))
+
+if njit is not None:
+    # Firma explícita: se compila al importar y no en la primera consulta
+    _uptime_stats = njit(
+        'Tuple((int64, int64, float64))(int16[:], float32[:], int64[:], int64, int64)',
+        cache=True
+    )(_uptime_loop)
+else:
+    _uptime_stats = _uptime_numpy
+
+# Número máximo de puntos con los que se dibujan marcadores en el gráfico de tiempos
+MARKER_MAX_POINTS = 200
+
+# Longitud máxima y caracteres no permitidos en el nombre de una hoja de Excel
+SHEET_NAME_MAX_LENGTH = 31
+_INVALID_SHEET_CHARS = str.maketrans('', '', '[]:*?/\\')
+
+def _sheet_name(url: str, used: set) -> str:
+    """
+    Construye un nombre de hoja de Excel válido y único para una URL.
+    
+    Se quita el esquema y los caracteres no permitidos, se recorta a
+    SHEET_NAME_MAX_LENGTH caracteres y, si el nombre ya existe (Excel no
+    distingue mayúsculas), se agrega un sufijo numérico.
+    
+    Args:
+        url (str): URL del sitio web
+        used (set): Nombres ya usados en minúsculas; se agrega el nuevo
+    
+    Returns:
+        str: Nombre de la hoja
+    """
+    base = url.partition('://')[2] or url
+    base = base.translate(_INVALID_SHEET_CHARS).strip("'")[:SHEET_NAME_MAX_LENGTH] or 'URL'
+    
+    name, n = base, 1
+    while name.lower() in used:
+        n += 1
+        suffix = f' ({n})'
+        name = base[:SHEET_NAME_MAX_LENGTH - len(suffix)] + suffix
+    used.add(name.lower())
+    return name
 
 class ReportGenerator:
     """Genera reportes y visualizaciones de los datos de verificación."""
     
-    def __init__(self, checker):
+    def __init__(self, checker, parent=None):
+        """
+        Inicializa el generador.
+        
+        matplotlib no se importa hasta el primer gráfico: la figura de
+        tiempos se crea entonces una sola vez y se reutiliza.
+        
+        Args:
+            checker: WebsiteChecker del que se leen los historiales
+            parent: Widget de Tk donde incrustar el gráfico (opcional). Si
+                se indica, las actualizaciones se dibujan con blitting.
+        """
         self.checker = checker
+        self.parent = parent
+        self._background = None
+        self._drawn_view = None
+        self.fig = None
+    
+    def _build_figure(self):
+        """Crea la figura, los ejes y la línea reutilizados por plot_response_times."""
+        if self.parent is not None:
+            from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+            from matplotlib.figure import Figure
+            
+            self.fig = Figure(figsize=(10, 6), layout='constrained')
+            self.ax = self.fig.add_subplot(111)
+            self.canvas = FigureCanvasTkAgg(self.fig, master=self.parent)
+        else:
+            import matplotlib.pyplot as plt
+            
+            self.fig, self.ax = plt.subplots(figsize=(10, 6), layout='constrained')
+            self.canvas = self.fig.canvas
+        
+        # La línea animada no forma parte del fondo guardado para el blitting
+        self.line, = self.ax.plot([], [], marker='o', animated=self.parent is not None)
+        self.ax.xaxis_date()
+        self.ax.set_xlabel('Fecha/Hora')
+        self.ax.set_ylabel('Tiempo de respuesta (ms)')
+        self.ax.grid(True)
+        self.ax.tick_params(axis='x', labelrotation=45)
+        
+        if self.parent is not None:
+            # Cada dibujado completo (incluido un cambio de tamaño) renueva el fondo
+            self.canvas.mpl_connect('draw_event', self._on_draw)
+    
+    def _on_draw(self, event):
+        """Guarda el fondo tras un dibujado completo y dibuja encima la línea."""
+        self._background = self.canvas.copy_from_bbox(self.fig.bbox)
+        self.ax.draw_artist(self.line)
+    
+    def _history_columns(self, url: str) -> tuple:
+        """
+        Obtiene las columnas del historial de una URL.
+        
+        Args:
+            url (str): URL del sitio web
+        
+        Returns:
+            tuple: (marcas de tiempo, códigos de estado, tiempos de respuesta en ms)
+        """
+        history = self.checker.get_history_buffer(url)
+        if history is None:
+            return (
+                np.empty(0, dtype='datetime64[ns]'),
+                np.empty(0, dtype=np.int16),
+                np.empty(0, dtype=np.float32)
+            )
+        return history.timestamps, history.status_codes, history.response_ms
     
     def generate_uptime_report(self, url: str, days: int = 7) -> dict:
         """Genera un reporte de uptime para los últimos N días."""
-        history = self.checker.get_history(url)
+        timestamps, status_codes, response_ms = self._history_columns(url)
         end_date = datetime.now()
         start_date = end_date - timedelta(days=days)
         
-        # Filtrar registros por fecha
-        relevant_history = [
-            check for check in history
-            if start_date <= check['timestamp'] <= end_date
-        ]
-        
-        total_checks = len(relevant_history)
-        successful_checks = sum(
-            1 for check in relevant_history
-            if check['status_code'] == 200
+        total_checks, successful_checks, average_response_time = _uptime_stats(
+            status_codes,
+            response_ms,
+            timestamps.view(np.int64),
+            np.datetime64(start_date, 'ns').astype(np.int64),
+            np.datetime64(end_date, 'ns').astype(np.int64)
         )
         
         return {
@@ -35,65 +218,122 @@ class ReportGenerator:
             'total_checks': total_checks,
             'successful_checks': successful_checks,
             'uptime_percentage': (successful_checks / total_checks * 100) if total_checks > 0 else 0,
-            'average_response_time': sum(
-                (check['end_time'] - check['start_time']).total_seconds() * 1000
-                for check in relevant_history
-            ) / total_checks if total_checks > 0 else 0
+            'average_response_time': average_response_time
         }
     
     def plot_response_times(self, url: str, output_file: str = None):
-        """Genera un gráfico de tiempos de respuesta."""
-        history = self.checker.get_history(url)
-        
-        dates = [check['timestamp'] for check in history]
-        response_times = [
-            (check['end_time'] - check['start_time']).total_seconds() * 1000
-            for check in history
-        ]
-        
-        plt.figure(figsize=(10, 6))
-        plt.plot(dates, response_times, marker='o')
-        plt.title(f'Tiempos de respuesta para {url}')
-        plt.xlabel('Fecha/Hora')
-        plt.ylabel('Tiempo de respuesta (ms)')
-        plt.grid(True)
-        plt.xticks(rotation=45)
+        """
+        Genera un gráfico de tiempos de respuesta.
+        
+        Reutiliza la figura y la línea creadas al inicializar el generador;
+        en un gráfico incrustado, si los ejes no cambian solo se vuelve a
+        dibujar la línea sobre el fondo guardado.
+        
+        Args:
+            url (str): URL cuyo historial se dibuja
+            output_file (str): Archivo donde guardar el gráfico (opcional)
+        """
+        from matplotlib.dates import date2num
+        
+        if self.parent is None:
+            import matplotlib.pyplot as plt
+        
+        if self.fig is None or (self.parent is None and not plt.fignum_exists(self.fig.number)):
+            # Primer gráfico, o la ventana de pyplot se cerró: crear la figura
+            self._build_figure()
+        
+        timestamps, _, response_ms = self._history_columns(url)
+        
+        # Omitir las verificaciones fallidas (sin tiempo de respuesta)
+        valid = response_ms >= 0
+        dates = date2num(timestamps[valid])
+        times = response_ms[valid]
+        
+        # Con más puntos que píxeles de ancho, dibujar solo mínimos y máximos
+        n = len(times)
+        target = max(2, int(self.ax.bbox.width))
+        if n > target:
+            keep = _minmax_indices(times, target)
+            dates, times = dates[keep], times[keep]
+        
+        self.line.set_marker('o' if n <= MARKER_MAX_POINTS else 'None')
+        self.line.set_data(dates, times)
+        self.ax.set_title(f'Tiempos de respuesta para {url}')
+        self.ax.relim()
+        self.ax.autoscale_view()
         
         if output_file:
-            plt.savefig(output_file)
+            # Las líneas animadas no se incluyen en savefig
+            animated = self.line.get_animated()
+            self.line.set_animated(False)
+            self.fig.savefig(output_file)
+            self.line.set_animated(animated)
+        elif self.parent is not None:
+            self._redraw(url)
         else:
             plt.show()
     
+    def _redraw(self, url: str):
+        """Actualiza el gráfico incrustado con blitting si los ejes no cambian."""
+        view = (url, self.ax.get_xlim(), self.ax.get_ylim())
+        
+        if self._background is None or view != self._drawn_view:
+            # Cambió el título o la escala: hace falta un dibujado completo
+            self._drawn_view = view
+            self.canvas.draw_idle()
+            return
+        
+        self.canvas.restore_region(self._background)
+        self.ax.draw_artist(self.line)
+        self.canvas.blit(self.ax.bbox)
+    
     def export_to_excel(self, filename: str):
-        """Exporta todos los datos a un archivo Excel."""
-        workbook = pd.ExcelWriter(filename, engine='xlsxwriter')
-        
-        # Hoja de resumen
-        summary_data = []
-        for url in self.checker._history.keys():
-            stats = self.checker.get_statistics(url)
-            summary_data.append({
-                'URL': url,
-                'Total Checks': stats['total_checks'],
-                'Success Rate': f"{stats['success_rate']:.2f}%",
-                'Avg Response Time': f"{stats['avg_response_time']:.2f}ms"
-            })
-        
-        pd.DataFrame(summary_data).to_excel(
-            workbook,
-            sheet_name='Summary',
-            index=False
-        )
+        """
+        Exporta todos los datos a un archivo Excel.
         
-        # Hoja detallada por URL
-        for url in self.checker._history.keys():
-            history = self.checker.get_history(url)
-            df = pd.DataFrame([{
-                'Timestamp': check['timestamp'],
-                'Status Code': check['status_code'],
-                'Response Time': (check['end_time'] - check['start_time']).total_seconds() * 1000
-            } for check in history])
-            
-            df.to_excel(workbook, sheet_name=url[:31], index=False)
+        El libro se escribe con xlsxwriter en modo constant_memory: cada
+        fila se vuelca a disco al pasar a la siguiente, por lo que las hojas
+        se escriben fila a fila (to_excel de pandas escribe por columnas y
+        perdería datos en este modo).
         
-        workbook.close()
\ No newline at end of file
+        Args:
+            filename (str): Archivo .xlsx de destino
+        """
+        import xlsxwriter
+        
+        urls = list(self.checker._history.keys())
+        workbook = xlsxwriter.Workbook(filename, {
+            'constant_memory': True,
+            'nan_inf_to_errors': True,
+            'default_date_format': 'yyyy-mm-dd hh:mm:ss'
+        })
+        
+        try:
+            # Hoja de resumen
+            summary = workbook.add_worksheet('Summary')
+            summary.write_row(0, 0, ('URL', 'Total Checks', 'Success Rate', 'Avg Response Time'))
+            for row, url in enumerate(urls, start=1):
+                stats = self.checker.get_statistics(url)
+                summary.write_row(row, 0, (
+                    url,
+                    stats['total_checks'],
+                    f"{stats['success_rate']:.2f}%",
+                    f"{stats['avg_response_time']:.2f}ms"
+                ))
+            
+            # Hoja detallada por URL, leída directamente de las columnas del historial
+            used = {'summary'}
+            for url in urls:
+                timestamps, status_codes, response_ms = self._history_columns(url)
+                sheet = workbook.add_worksheet(_sheet_name(url, used))
+                sheet.write_row(0, 0, ('Timestamp', 'Status Code', 'Response Time'))
+                
+                records = zip(
+                    timestamps.astype('datetime64[us]').tolist(),
+                    status_codes.tolist(),
+                    response_ms.tolist()
+                )
+                for row, record in enumerate(records, start=1):
+                    sheet.write_row(row, 0, record)
+        finally:
+            workbook.close()
\ No newline at end of file
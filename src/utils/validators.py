@@ -4,27 +4,299 @@ Validators
 Proporciona funciones de validación para URLs y otras utilidades.
 """
 
-import re
-from typing import Optional, Tuple
-from urllib.parse import urlparse
+import asyncio
+import functools
+import ipaddress
+import json
+import os
+import threading
+import time
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from urllib.parse import SplitResult, unquote_plus, urlsplit
 import socket
+import sys
 import logging
+from dataclasses import dataclass, fields, replace
+
+# Longitud máxima de una URL aceptada
+MAX_URL_LENGTH = 2048
+
+# Longitud máxima de un nombre de dominio (RFC 1035)
+MAX_HOSTNAME_LENGTH = 253
+
+# Esquemas aceptados (internados: las comparaciones con los esquemas que
+# devuelve _split_http se resuelven por identidad)
+VALID_SCHEMES = frozenset(sys.intern(scheme) for scheme in ('http', 'https', 'ftp', 'ftps'))
+
+# Segundos que se conserva en caché la resolución DNS de un dominio
+DNS_CACHE_TTL = 300
+
+# Número máximo de URLs cuya validación se guarda en disco
+VALIDATION_CACHE_SIZE = 4096
+
+# Versión de las reglas de validación: incrementarla al cambiar las reglas
+# descarta los resultados guardados en disco con las anteriores
+VALIDATION_RULES_VERSION = 2
+
+def _netloc_end(rest: str) -> int:
+    """Posición donde termina el netloc: el primer '/', '?' o '#' (o el final)."""
+    end = len(rest)
+    for delimiter in '/?#':
+        i = rest.find(delimiter, 0, end)
+        if i >= 0:
+            end = i
+    return end
+
+def _split_http(url: str) -> SplitResult:
+    """
+    Descompone una URL http(s) con str.partition, sin pasar por urlsplit.
+    
+    Solo se usa para URLs ASCII imprimibles que empiezan por http:// o
+    https:// y no contienen corchetes (IPv6); el resto (por ejemplo, con
+    tabuladores o saltos de línea) se delega en urlsplit, que trata esos
+    casos.
+    
+    Args:
+        url (str): URL a descomponer
+    
+    Returns:
+        SplitResult: Igual que urlsplit(url)
+    """
+    if (not url.startswith(('http://', 'https://')) or not url.isascii()
+            or not url.isprintable() or '[' in url or ']' in url):
+        return urlsplit(url)
+    
+    scheme, _, rest = url.partition('://')
+    scheme = sys.intern(scheme)
+    
+    end = _netloc_end(rest)
+    netloc, rest = rest[:end], rest[end:]
+    
+    rest, _, fragment = rest.partition('#')
+    path, _, query = rest.partition('?')
+    return SplitResult(scheme, netloc, path, query, fragment)
+
+# _split_http cacheado por URL (SplitResult es inmutable, se puede compartir)
+_cached_urlsplit = functools.lru_cache(maxsize=4096)(_split_http)
+
+def _is_valid_hostname(hostname: str) -> bool:
+    """
+    Comprueba un nombre de host sin expresiones regulares.
+    
+    Se aceptan localhost, direcciones IPv4 y dominios de al menos dos
+    etiquetas (de 1 a 63 caracteres alfanuméricos o guiones, sin guion
+    al principio ni al final) con un TLD de al menos dos caracteres y
+    MAX_HOSTNAME_LENGTH caracteres en total. Los caracteres se comprueban
+    con métodos de str (implementados en C) sobre el nombre completo, y
+    en Python solo se recorren las etiquetas.
+    
+    Args:
+        hostname (str): Nombre de host en minúsculas, tal como lo da urlsplit
+    
+    Returns:
+        bool: True si el nombre de host es válido
+    """
+    if hostname == 'localhost':
+        return True
+    
+    # Descartar de inmediato los nombres demasiado largos
+    if len(hostname.rstrip('.')) > MAX_HOSTNAME_LENGTH:
+        return False
+    
+    # Solo una IPv4 puede acabar en dígito tras un TLD válido de varios
+    # dígitos; evitar la excepción de ipaddress en los dominios normales
+    if hostname[-1:].isdigit():
+        try:
+            ipaddress.IPv4Address(hostname)
+            return True
+        except ValueError:
+            pass
+    
+    # Se admite un punto final (nombre de dominio absoluto)
+    name = hostname[:-1] if hostname.endswith('.') else hostname
+    
+    # Solo letras ASCII, dígitos, guiones y puntos
+    chars = name.replace('-', '').replace('.', '')
+    if not (chars.isascii() and chars.isalnum()):
+        return False
+    
+    *labels, tld = name.split('.')
+    if not labels or len(tld) < 2:
+        return False
+    
+    return all(
+        0 < len(label) <= 63 and label[0] != '-' and label[-1] != '-'
+        for label in labels
+    )
+
+@functools.lru_cache(maxsize=1024)
+def _validate(url: str) -> bool:
+    """
+    Valida la estructura de una URL (resultado cacheado por URL).
+    
+    urlsplit se encarga de separar esquema, host, puerto y ruta; el
+    nombre de host se comprueba después con _is_valid_hostname.
+    
+    Args:
+        url (str): URL a validar
+    
+    Returns:
+        bool: True si la URL es válida, False en caso contrario
+    """
+    # Agregar protocolo si no está presente
+    if not url.startswith(('http://', 'https://')):
+        url = 'https://' + url
+    
+    try:
+        result = _cached_urlsplit(url)
+        # Acceder al puerto valida que sea numérico y esté en rango
+        result.port
+    except ValueError:
+        return False
+    
+    # Un ':' final en el netloc es un puerto vacío, que urlsplit ignora
+    if (result.scheme not in VALID_SCHEMES or not result.netloc
+            or result.netloc.endswith(':')):
+        return False
+    
+    hostname = result.hostname
+    return hostname is not None and _is_valid_hostname(hostname)
+
+# slots=True solo está disponible a partir de Python 3.10
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+class _FieldAccess:
+    """
+    Permite leer los campos también como claves (info['scheme']).
+    
+    Los resultados se usan como los diccionarios que se devolvían antes:
+    admiten ``in``, iteración sobre las claves, ``get`` y ``dict(info)``.
+    """
+    
+    __slots__ = ()
+    
+    # Nombres de los campos, en orden (los asigna _with_keys)
+    _keys: Tuple[str, ...] = ()
+    
+    def __getitem__(self, key: str):
+        if key not in self._keys:
+            raise KeyError(key)
+        return getattr(self, key)
+    
+    def __contains__(self, key) -> bool:
+        return key in self._keys
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys)
+    
+    def get(self, key: str, default=None):
+        """Devuelve el campo indicado o default si no existe."""
+        return getattr(self, key) if key in self._keys else default
+    
+    def keys(self) -> Tuple[str, ...]:
+        """Nombres de los campos, en orden."""
+        return self._keys
+    
+    def as_dict(self) -> dict:
+        """Devuelve los campos como diccionario."""
+        return {key: getattr(self, key) for key in self._keys}
+
+def _with_keys(cls):
+    """Guarda en la clase los nombres de sus campos, calculados una sola vez."""
+    cls._keys = tuple(f.name for f in fields(cls))
+    return cls
+
+@_with_keys
+@dataclass(frozen=True, **_DATACLASS_OPTIONS)
+class URLInfo(_FieldAccess):
+    """Información de una URL devuelta por get_url_info."""
+    scheme: str
+    domain: str
+    path: str
+    query: str
+    fragment: str
+    port: int
+
+@_with_keys
+@dataclass(frozen=True, **_DATACLASS_OPTIONS)
+class URLParts(_FieldAccess):
+    """Partes de una URL devueltas por get_url_parts."""
+    scheme: str
+    username: Optional[str]
+    password: Optional[str]
+    hostname: Optional[str]
+    port: Optional[int]
+    path: str
+    query: Union[str, dict]
+    fragment: str
+
+@functools.lru_cache(maxsize=4096)
+def _url_info(parsed: SplitResult) -> URLInfo:
+    """Información de una URL ya validada (cacheada; es inmutable)."""
+    return URLInfo(
+        scheme=parsed.scheme,
+        domain=parsed.netloc,
+        path=parsed.path,
+        query=parsed.query,
+        fragment=parsed.fragment,
+        port=parsed.port or (443 if parsed.scheme == 'https' else 80)
+    )
+
+@functools.lru_cache(maxsize=4096)
+def _parse_query(query: str) -> dict:
+    """
+    Parámetros de una query (cacheados; no modificar el resultado).
+    
+    Recorre la query una sola vez en lugar de usar parse_qs: conserva los
+    valores vacíos y las claves repetidas se agrupan en una lista.
+    """
+    params = {}
+    for pair in query.split('&'):
+        if not pair:
+            continue
+        key, _, value = pair.partition('=')
+        key = unquote_plus(key) if '%' in key or '+' in key else key
+        value = unquote_plus(value) if '%' in value or '+' in value else value
+        
+        previous = params.get(key)
+        if previous is None:
+            params[key] = value
+        elif isinstance(previous, list):
+            previous.append(value)
+        else:
+            params[key] = [previous, value]
+    return params
+
+@functools.lru_cache(maxsize=4096)
+def _url_parts(parsed: SplitResult) -> URLParts:
+    """Partes de una URL ya validada, con la query sin parsear (cacheadas)."""
+    return URLParts(
+        scheme=parsed.scheme,
+        username=parsed.username,
+        password=parsed.password,
+        hostname=parsed.hostname,
+        port=parsed.port,
+        path=parsed.path,
+        query=parsed.query,
+        fragment=parsed.fragment
+    )
 
 class URLValidator:
     """Clase para validar URLs y proporcionar información sobre ellas."""
     
     def __init__(self):
-        """Inicializa el validador con expresiones regulares y configuración."""
-        # Expresión regular para validar URLs
-        self.url_pattern = re.compile(
-            r'^(?:http|ftp)s?://'  # http:// o https://
-            r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+(?:[A-Z]{2,6}\.?|[A-Z0-9-]{2,}\.?)|'  # dominio
-            r'localhost|'  # localhost
-            r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # IP
-            r'(?::\d+)?'  # puerto opcional
-            r'(?:/?|[/?]\S+)$', re.IGNORECASE)
-        
+        """Inicializa el validador con su caché DNS y configuración."""
         self.logger = logging.getLogger(__name__)
+        
+        # Resultados de validación cargados de disco: URL -> es válida
+        self._known: Dict[str, bool] = {}
+        
+        # Caché DNS: dominio -> (IP, instante de caducidad)
+        self._dns_cache: Dict[str, Tuple[Optional[str], float]] = {}
+        
+        # Event loop de fondo para resolver DNS desde la API síncrona
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_lock = threading.Lock()
     
     def is_valid_url(self, url: str) -> bool:
         """
@@ -32,61 +304,153 @@ class URLValidator:
         
         Args:
             url (str): URL a validar
-
+        
         Returns:
             bool: True si la URL es válida, False en caso contrario
         """
-        try:
-            if not url:
-                return False
-                
-            # Agregar protocolo si no está presente
-            if not url.startswith(('http://', 'https://')):
-                url = 'https://' + url
-            
-            # Validar formato con regex
-            if not self.url_pattern.match(url):
+        if not url or not isinstance(url, str) or len(url) > MAX_URL_LENGTH:
+            return False
+        
+        if not url.startswith(('http://', 'https://')):
+            # Sin esquema http(s) solo se admite un dominio con puerto
+            # opcional (se le agrega https://): descartar sin parsear lo que
+            # empieza por '/', otros esquemas ("ftp://host", "http:/host",
+            # "mailto:x@host") y las credenciales ("user:pass@host")
+            head = url[:_netloc_end(url)]
+            if not head or '@' in head:
                 return False
-            
-            # Validar parsing de la URL
-            result = urlparse(url)
-            if not all([result.scheme, result.netloc]):
+            _, colon, port = head.partition(':')
+            if colon and not (port.isascii() and port.isdigit()):
                 return False
-                
-            return True
-            
-        except Exception as e:
-            self.logger.error(f"Error validando URL {url}: {str(e)}")
-            return False
+        
+        valid = self._known.get(url)
+        if valid is not None:
+            return valid
+        return _validate(url)
     
-    def get_url_info(self, url: str) -> Optional[dict]:
+    def is_valid_urls(self, urls: Iterable[str]) -> List[bool]:
         """
-        Obtiene información detallada sobre una URL.
+        Verifica varias URLs de una vez.
+        
+        Cada URL distinta se valida una sola vez aunque aparezca repetida
+        (por ejemplo, en una lista pegada por el usuario).
+        
+        Args:
+            urls (Iterable[str]): URLs a validar
+        
+        Returns:
+            List[bool]: Resultado de cada URL, en el mismo orden
+        """
+        seen: Dict[str, bool] = {}
+        results = []
+        for url in urls:
+            valid = seen.get(url)
+            if valid is None:
+                valid = seen[url] = self.is_valid_url(url)
+            results.append(valid)
+        return results
+    
+    def _parse_or_none(self, url: str) -> Optional[SplitResult]:
+        """
+        Valida una URL y devuelve su descomposición (cacheada por URL).
+        
+        Como en la validación, a las URLs sin esquema se les agrega
+        https:// antes de descomponerlas. La validación comprueba también el
+        puerto, por lo que leer ``parsed.port`` del resultado no lanza
+        excepciones.
         
         Args:
             url (str): URL a analizar
-
+        
         Returns:
-            Optional[dict]: Diccionario con información de la URL o None si es inválida
+            Optional[SplitResult]: Resultado de urlsplit o None si es inválida
+        """
+        if not self.is_valid_url(url):
+            return None
+        return _cached_urlsplit(self.normalize_url(url))
+    
+    def clear_cache(self):
+        """Vacía las cachés de validación, de urlsplit, de información de URLs y de DNS."""
+        _validate.cache_clear()
+        _cached_urlsplit.cache_clear()
+        _url_info.cache_clear()
+        _url_parts.cache_clear()
+        _parse_query.cache_clear()
+        self._dns_cache.clear()
+        self._known.clear()
+    
+    def load_cache(self, filename: str):
         """
+        Carga los resultados de validación guardados en una ejecución anterior.
+        
+        Si el archivo se guardó con otra versión de las reglas de validación
+        (VALIDATION_RULES_VERSION) se elimina sin cargarlo.
+        
+        Args:
+            filename (str): Archivo JSON creado por save_cache
+        """
+        if not os.path.exists(filename):
+            return
         try:
-            if not self.is_valid_url(url):
-                return None
-                
-            parsed = urlparse(url)
-            
-            return {
-                'scheme': parsed.scheme,
-                'domain': parsed.netloc,
-                'path': parsed.path,
-                'query': parsed.query,
-                'fragment': parsed.fragment,
-                'port': parsed.port or (443 if parsed.scheme == 'https' else 80)
-            }
-            
-        except Exception as e:
-            self.logger.error(f"Error obteniendo información de URL {url}: {str(e)}")
+            with open(filename, 'r') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"No se pudo cargar la caché de validación {filename}: {str(e)}")
+            return
+        
+        if not isinstance(data, dict) or data.get('version') != VALIDATION_RULES_VERSION:
+            self.logger.info(f"Descartando la caché de validación {filename}: reglas anteriores")
+            try:
+                os.remove(filename)
+            except OSError:
+                pass
+            return
+        
+        known = data.get('urls')
+        if not isinstance(known, dict):
+            return
+        self._known = {
+            url: valid for url, valid in known.items()
+            if isinstance(url, str) and isinstance(valid, bool)
+        }
+    
+    def save_cache(self, filename: str, urls: Iterable[str]):
+        """
+        Guarda de forma atómica el resultado de validación de las URLs indicadas.
+        
+        Se conservan como mucho las últimas VALIDATION_CACHE_SIZE URLs.
+        
+        Args:
+            filename (str): Archivo JSON de destino
+            urls (Iterable[str]): URLs a guardar, de la menos a la más reciente
+        """
+        urls = list(urls)[-VALIDATION_CACHE_SIZE:]
+        known = {url: self.is_valid_url(url) for url in urls}
+        
+        tmp_file = filename + '.tmp'
+        try:
+            with open(tmp_file, 'w') as f:
+                json.dump({'version': VALIDATION_RULES_VERSION, 'urls': known}, f)
+            os.replace(tmp_file, filename)
+        except OSError as e:
+            self.logger.warning(f"No se pudo guardar la caché de validación {filename}: {str(e)}")
+    
+    def get_url_info(self, url: str) -> Optional[URLInfo]:
+        """
+        Obtiene información detallada sobre una URL.
+        
+        Args:
+            url (str): URL a analizar
+        
+        Returns:
+            Optional[URLInfo]: Información de la URL (inmutable, también accesible
+                como info['campo']) o None si es inválida
+        """
+        parsed = self._parse_or_none(url)
+        if parsed is None:
             return None
+        
+        return _url_info(parsed)
     
     def normalize_url(self, url: str) -> str:
         """
@@ -94,7 +458,7 @@ class URLValidator:
         
         Args:
             url (str): URL a normalizar
-
+        
         Returns:
             str: URL normalizada
         """
@@ -102,43 +466,130 @@ class URLValidator:
             return 'https://' + url
         return url
     
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        """Obtiene el event loop de fondo, iniciándolo en un hilo si es necesario."""
+        with self._loop_lock:
+            if self._loop is None or self._loop.is_closed():
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=self._loop.run_forever,
+                    name="URLValidatorLoop",
+                    daemon=True
+                ).start()
+            return self._loop
+    
+    def _cached_ip(self, domain: str) -> Tuple[bool, Optional[str]]:
+        """
+        Busca la IP de un dominio en la caché DNS.
+        
+        Args:
+            domain (str): Dominio a buscar
+        
+        Returns:
+            Tuple[bool, Optional[str]]: (encontrada y vigente, IP)
+        """
+        entry = self._dns_cache.get(domain)
+        if entry is None or entry[1] < time.monotonic():
+            return False, None
+        return True, entry[0]
+    
+    async def _resolve(self, domain: str) -> Optional[str]:
+        """
+        Resuelve la IP de un dominio sin bloquear, usando la caché DNS.
+        
+        Args:
+            domain (str): Dominio a resolver
+        
+        Returns:
+            Optional[str]: IP del dominio o None si no se pudo resolver
+        """
+        found, ip = self._cached_ip(domain)
+        if found:
+            return ip
+        
+        try:
+            infos = await asyncio.get_running_loop().getaddrinfo(
+                domain, None, family=socket.AF_INET
+            )
+            ip = infos[0][4][0]
+        except (socket.gaierror, UnicodeError, IndexError):
+            # Dominio inexistente o no codificable en IDNA
+            ip = None
+        
+        self._dns_cache[domain] = (ip, time.monotonic() + DNS_CACHE_TTL)
+        return ip
+    
+    @staticmethod
+    def _domain_info(parsed: SplitResult, ip: Optional[str]) -> dict:
+        """
+        Construye el diccionario de información del dominio de una URL.
+        
+        TLD, nombre y subdominio se toman del nombre de host (sin usuario
+        ni puerto) con un solo rsplit desde la derecha.
+        
+        Args:
+            parsed (SplitResult): URL descompuesta
+            ip (Optional[str]): IP del dominio
+        
+        Returns:
+            dict: Información del dominio
+        """
+        parts = (parsed.hostname or parsed.netloc).rsplit('.', 2)
+        
+        return {
+            'domain': parsed.netloc,
+            'ip': ip,
+            'tld': parts[-1] if len(parts) > 1 else None,
+            'subdomain': parts[0] if len(parts) == 3 else None,
+            'domain_name': parts[-2] if len(parts) > 1 else parts[0]
+        }
+    
+    async def get_domain_info_async(self, url: str) -> Optional[dict]:
+        """
+        Obtiene información sobre el dominio de una URL (versión asíncrona).
+        
+        Args:
+            url (str): URL para extraer información del dominio
+        
+        Returns:
+            Optional[dict]: Diccionario con información del dominio o None si es inválida
+        """
+        parsed = self._parse_or_none(url)
+        if parsed is None:
+            return None
+        
+        # Obtener IP del dominio
+        ip = await self._resolve(parsed.hostname or parsed.netloc)
+        
+        return self._domain_info(parsed, ip)
+    
     def get_domain_info(self, url: str) -> Optional[dict]:
         """
         Obtiene información sobre el dominio de una URL.
         
+        Si la IP del dominio está en caché se responde sin salir del hilo
+        actual; en caso contrario la resolución se hace en el event loop
+        de fondo.
+        
         Args:
             url (str): URL para extraer información del dominio
-
+        
         Returns:
             Optional[dict]: Diccionario con información del dominio o None si es inválida
         """
-        try:
-            if not self.is_valid_url(url):
-                return None
-                
-            parsed = urlparse(url)
-            domain = parsed.netloc
-            
-            # Obtener IP del dominio
-            try:
-                ip = socket.gethostbyname(domain)
-            except socket.gaierror:
-                ip = None
-            
-            # Dividir el dominio en sus partes
-            parts = domain.split('.')
-            
-            return {
-                'domain': domain,
-                'ip': ip,
-                'tld': parts[-1] if len(parts) > 1 else None,
-                'subdomain': '.'.join(parts[:-2]) if len(parts) > 2 else None,
-                'domain_name': parts[-2] if len(parts) > 1 else parts[0]
-            }
-            
-        except Exception as e:
-            self.logger.error(f"Error obteniendo información del dominio {url}: {str(e)}")
+        parsed = self._parse_or_none(url)
+        if parsed is None:
             return None
+        
+        found, ip = self._cached_ip(parsed.hostname or parsed.netloc)
+        if found:
+            return self._domain_info(parsed, ip)
+        
+        future = asyncio.run_coroutine_threadsafe(
+            self.get_domain_info_async(url),
+            self._get_loop()
+        )
+        return future.result()
     
     def is_secure_url(self, url: str) -> Tuple[bool, str]:
         """
@@ -146,59 +597,52 @@ class URLValidator:
         
         Args:
             url (str): URL a verificar
-
+        
         Returns:
             Tuple[bool, str]: (es_segura, razón)
         """
-        try:
-            if not self.is_valid_url(url):
-                return False, "URL inválida"
-                
-            parsed = urlparse(url)
-            
-            if parsed.scheme == 'https':
-                return True, "La URL utiliza HTTPS"
-            elif parsed.scheme == 'http':
-                return False, "La URL utiliza HTTP inseguro"
-            else:
-                return False, f"Esquema desconocido: {parsed.scheme}"
-                
-        except Exception as e:
-            self.logger.error(f"Error verificando seguridad de URL {url}: {str(e)}")
-            return False, f"Error al verificar la URL: {str(e)}"
-    
-    def get_url_parts(self, url: str) -> Optional[dict]:
+        if not self.is_valid_url(url):
+            return False, "URL inválida"
+        
+        # El esquema se distingue por el prefijo, sin descomponer la URL
+        if url.startswith('https://'):
+            return True, "La URL utiliza HTTPS"
+        elif url.startswith('http://'):
+            return False, "La URL utiliza HTTP inseguro"
+        else:
+            return False, f"Esquema desconocido: {_cached_urlsplit(url).scheme}"
+    
+    def get_url_parts(self, url: str, parse_query: bool = True) -> Optional[URLParts]:
         """
         Descompone una URL en sus partes constituyentes.
         
+        Los parámetros de query con un único valor se devuelven como cadena
+        y los repetidos como lista de valores.
+        
         Args:
             url (str): URL a descomponer
-
+            parse_query (bool): Si es False, 'query' es la cadena original y
+                no se parsean los parámetros
+        
         Returns:
-            Optional[dict]: Diccionario con las partes de la URL o None si es inválida
+            Optional[URLParts]: Partes de la URL (inmutables, también accesibles
+                como parts['campo']) o None si es inválida
         """
-        try:
-            if not self.is_valid_url(url):
-                return None
-                
-            parsed = urlparse(url)
-            query_params = {}
-            
-            # Parsear parámetros de query si existen
-            if parsed.query:
-                query_params = dict(param.split('=') for param in parsed.query.split('&'))
-            
-            return {
-                'scheme': parsed.scheme,
-                'username': parsed.username,
-                'password': parsed.password,
-                'hostname': parsed.hostname,
-                'port': parsed.port,
-                'path': parsed.path,
-                'query': query_params,
-                'fragment': parsed.fragment
-            }
-            
-        except Exception as e:
-            self.logger.error(f"Error descomponiendo URL {url}: {str(e)}")
-            return None
\ No newline at end of file
+        parsed = self._parse_or_none(url)
+        if parsed is None:
+            return None
+        
+        parts = _url_parts(parsed)
+        if not parse_query:
+            return parts
+        
+        # Copia de los parámetros cacheados, que el llamador puede modificar
+        query = {
+            key: list(value) if isinstance(value, list) else value
+            for key, value in _parse_query(parsed.query).items()
+        }
+        return replace(parts, query=query)
+
+# Validador compartido: comparte la caché DNS, el event loop de fondo y
+# los resultados cargados de disco entre todos los que lo importan
+DEFAULT_VALIDATOR = URLValidator()
\ No newline at end of file
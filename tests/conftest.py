@@ -0,0 +1,11 @@
+"""
+Test Configuration
+----------------
+Configuración común de pytest para Website Checker.
+"""
+
+import os
+
+# Backend sin ventanas para los gráficos: se fija antes de que se importe
+# matplotlib (src.utils.reports lo importa al dibujar el primer gráfico)
+os.environ.setdefault('MPLBACKEND', 'Agg')
\ No newline at end of file
@@ -4,16 +4,25 @@ Test Checker Module
 Pruebas unitarias para el módulo core.checker
 """
 
+import asyncio
+import ssl
 import pytest
 import urllib.error
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
+from aiohttp import web
+from aiohttp.test_utils import TestServer
 from datetime import datetime
-from src.core.checker import WebsiteChecker, CheckResult
+from src.core.checker import WebsiteChecker, CheckResult, MAX_HISTORY_PER_URL
+from src.core.history import HistoryBuffer
+from src.core.metrics import MetricsStore
+from src.core import checker as checker_module
 
 @pytest.fixture
 def checker():
-    """Fixture que proporciona una instancia de WebsiteChecker."""
-    return WebsiteChecker(timeout=5)
+    """Fixture que proporciona una instancia de WebsiteChecker (cerrada al terminar)."""
+    checker = WebsiteChecker(timeout=5)
+    yield checker
+    checker.shutdown()
 
 @pytest.fixture
 def mock_response():
@@ -27,6 +36,54 @@ def mock_response():
     mock.read.return_value = b"<html><body>Test</body></html>"
     return mock
 
+# Certificado decodificado tal como lo devuelve getpeercert()
+CERT = {
+    'issuer': ((('commonName', 'Test CA'),),),
+    'subject': ((('commonName', 'example.com'),),),
+    'version': 3,
+    'notAfter': 'Jan  1 00:00:00 2099 GMT',
+    'serialNumber': '01'
+}
+
+class FakeResponse:
+    """Respuesta HTTP en memoria para la sesión simulada."""
+    
+    def __init__(self, url: str, status: int = 200):
+        self.url = url
+        self.status = status
+        self.headers = {'Content-Type': 'text/html', 'Server': 'stub'}
+        self.content_length = 0
+        self.charset = 'utf-8'
+        self.content = Mock(readany=AsyncMock(return_value=b''))
+        # Conexión TLS sin certificado: evita abrir una conexión real
+        self.ssl_object = Mock(**{'getpeercert.return_value': b''})
+    
+    async def read(self) -> bytes:
+        return b''
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+class FakeSession:
+    """Sesión HTTP en memoria que responde al instante sin usar la red."""
+    
+    def __init__(self, connector=None, **kwargs):
+        self.connector = connector
+        self.closed = False
+        self.requested = []
+    
+    async def get(self, url: str, **kwargs) -> FakeResponse:
+        self.requested.append(url)
+        return FakeResponse(url)
+    
+    async def close(self):
+        self.closed = True
+        if self.connector is not None:
+            await self.connector.close()
+
 class TestWebsiteChecker:
     """Pruebas para la clase WebsiteChecker."""
     
@@ -35,7 +92,7 @@ class TestWebsiteChecker:
         assert checker.timeout == 5
         assert checker.verify_ssl == True
         assert isinstance(checker._history, dict)
-        assert isinstance(checker.metrics, dict)
+        assert isinstance(checker.metrics, MetricsStore)
     
     @patch('urllib.request.urlopen')
     def test_check_website_success(self, mock_urlopen, checker, mock_response):
@@ -104,7 +161,9 @@ class TestWebsiteChecker:
         """Prueba la limpieza del historial."""
         url = "https://example.com"
         checker.metrics[url] = {'checks': 1}
-        checker._history[url] = [{'timestamp': datetime.now()}]
+        checker._history[url] = HistoryBuffer.from_checks(
+            [{'timestamp': datetime.now()}], MAX_HISTORY_PER_URL
+        )
         
         checker.clear_history()
         
@@ -112,7 +171,7 @@ class TestWebsiteChecker:
         assert len(checker.metrics) == 0
     
     @pytest.mark.asyncio
-    async def test_bulk_check(self, checker):
+    async def test_bulk_check(self):
         """Prueba la verificación en masa de URLs."""
         urls = [
             "https://example1.com",
@@ -120,10 +179,187 @@ class TestWebsiteChecker:
             "https://example3.com"
         ]
         
+        checker = WebsiteChecker(timeout=5, session_factory=FakeSession)
+        
         results = await checker.bulk_check(urls)
+        session = checker._sessions[True]
+        await checker.close()
         
         assert len(results) == 3
         assert all(isinstance(result, CheckResult) for result in results.values())
+        assert all(result.status_code == 200 for result in results.values())
+        assert sorted(session.requested) == urls
+    
+    @pytest.mark.asyncio
+    async def test_bulk_check_limits_concurrency(self):
+        """Prueba que bulk_check respeta el límite de verificaciones simultáneas."""
+        checker = WebsiteChecker(max_concurrency=2)
+        running = 0
+        peak = 0
+        
+        async def fake_check(url):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return CheckResult(status_code=200, response_time=1.0)
+        
+        with patch.object(checker, 'check_website_async', side_effect=fake_check):
+            results = await checker.bulk_check([f"https://example{i}.com" for i in range(6)])
+        
+        assert len(results) == 6
+        assert peak == 2
+    
+    @pytest.mark.asyncio
+    async def test_bulk_check_deduplicates_and_wraps_errors(self, checker):
+        """Prueba que las URLs repetidas se verifican una vez y los errores se devuelven como CheckResult."""
+        fake_check = AsyncMock(side_effect=RuntimeError("boom"))
+        
+        with patch.object(checker, 'check_website_async', fake_check):
+            results = await checker.bulk_check(["https://example.com"] * 3)
+        
+        fake_check.assert_awaited_once_with("https://example.com")
+        assert results["https://example.com"].status_code == -1
+        assert results["https://example.com"].error == "boom"
+    
+    @pytest.mark.asyncio
+    async def test_head_only_falls_back_to_get(self):
+        """Prueba que el modo HEAD recurre a GET si el servidor no lo admite."""
+        checker = WebsiteChecker(head_only=True)
+        head_response = Mock(status=405)
+        get_response = Mock(status=200)
+        session = Mock(
+            head=AsyncMock(return_value=head_response),
+            get=AsyncMock(return_value=get_response)
+        )
+        
+        response = await checker._send_request(session, "https://example.com")
+        
+        assert response is get_response
+        head_response.release.assert_called_once()
+    
+    @pytest.mark.asyncio
+    async def test_get_reuses_connection_after_body(self):
+        """Prueba que con GET la conexión vuelve al pool aunque el cuerpo sea grande."""
+        peers = []
+        
+        async def handler(request):
+            peers.append(request.transport.get_extra_info('peername'))
+            return web.Response(body=b'x' * (2 * 1024 * 1024))
+        
+        app = web.Application()
+        app.router.add_get('/{page}', handler)
+        async with TestServer(app) as server:
+            async with WebsiteChecker(timeout=5) as checker:
+                for page in range(5):
+                    result = await checker.check_website_async(str(server.make_url(f'/{page}')))
+                    assert result.status_code == 200
+        
+        assert len(peers) == 5
+        assert len(set(peers)) == 1
+    
+    @pytest.mark.asyncio
+    async def test_session_reuse(self, checker):
+        """Prueba que la sesión HTTP se reutiliza entre verificaciones."""
+        session = await checker._get_session()
+        http_session = await checker._get_session(is_https=False)
+        
+        assert await checker._get_session() is session
+        assert http_session is not session
+        assert session.connector.limit == checker.max_connections
+        assert session.connector.limit_per_host == checker.max_connections_per_host
+        
+        await checker.close()
+        assert session.closed
+        assert http_session.closed
+    
+    def test_sessions_closed_when_loop_changes(self, checker):
+        """Prueba que las sesiones de un loop ya terminado se cierran al cambiar de loop."""
+        first = asyncio.run(checker._get_session())
+        second = asyncio.run(checker._get_session())
+        
+        assert second is not first
+        assert first.closed
+        assert first.connector is None
+        
+        asyncio.run(checker.close())
+        assert second.closed
+    
+    @pytest.mark.asyncio
+    async def test_ssl_info_cached_by_fingerprint(self, checker):
+        """Prueba que los certificados ya procesados se sirven desde caché."""
+        ssl_object = Mock()
+        ssl_object.getpeercert.side_effect = lambda binary_form=False: b'der' if binary_form else {
+            'issuer': ((('commonName', 'Test CA'),),),
+            'subject': ((('commonName', 'example.com'),),),
+            'version': 3,
+            'notAfter': 'Jan  1 00:00:00 2099 GMT',
+            'serialNumber': '01'
+        }
+        writer = Mock(wait_closed=AsyncMock())
+        writer.get_extra_info.return_value = ssl_object
+        
+        with patch('asyncio.open_connection', AsyncMock(return_value=(Mock(), writer))):
+            first = await checker._get_ssl_info_async("https://example.com")
+            second = await checker._get_ssl_info_async("https://example.com")
+        
+        assert first == second
+        assert first['subject'] == {'commonName': 'example.com'}
+        # Solo la primera llamada decodifica el certificado
+        assert ssl_object.getpeercert.call_count == 3
+    
+    @pytest.mark.asyncio
+    async def test_ssl_info_from_response(self, checker):
+        """Prueba que el certificado se lee del objeto SSL de la respuesta sin abrir conexiones."""
+        response = FakeResponse("https://example.com")
+        response.ssl_object.getpeercert.side_effect = lambda binary_form=False: b'der' if binary_form else CERT
+        open_connection = AsyncMock()
+        
+        with patch('asyncio.open_connection', open_connection):
+            info = await checker._get_ssl_info("https://example.com", response)
+        
+        assert info['subject'] == {'commonName': 'example.com'}
+        open_connection.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_ssl_info_without_verification(self):
+        """Prueba que sin verificación SSL el certificado se lee una vez por host con una conexión que verifica."""
+        verified = Mock()
+        verified.getpeercert.side_effect = lambda binary_form=False: b'der' if binary_form else CERT
+        writer = Mock(wait_closed=AsyncMock())
+        writer.get_extra_info.return_value = verified
+        
+        checker = WebsiteChecker(timeout=5, verify_ssl=False)
+        response = FakeResponse("https://example.com")
+        response.ssl_object.getpeercert.side_effect = lambda binary_form=False: b'der' if binary_form else {}
+        open_connection = AsyncMock(return_value=(Mock(), writer))
+        
+        with patch('asyncio.open_connection', open_connection):
+            info = await checker._get_ssl_info("https://example.com", response)
+            again = await checker._get_ssl_info("https://example.com", response)
+        
+        assert info['subject'] == {'commonName': 'example.com'}
+        assert again == info
+        assert open_connection.await_count == 1
+        assert open_connection.call_args.kwargs['ssl'].verify_mode == ssl.CERT_REQUIRED
+        assert checker.ssl_context.verify_mode == ssl.CERT_NONE
+    
+    @pytest.mark.asyncio
+    async def test_ssl_info_self_signed_without_verification(self):
+        """Prueba que un certificado no verificable se marca como presente sin reintentar la conexión."""
+        checker = WebsiteChecker(timeout=5, verify_ssl=False)
+        response = FakeResponse("https://self-signed.example.com")
+        response.ssl_object.getpeercert.side_effect = lambda binary_form=False: b'der' if binary_form else {}
+        open_connection = AsyncMock(side_effect=ssl.SSLCertVerificationError('self-signed'))
+        
+        with patch('asyncio.open_connection', open_connection):
+            info = await checker._get_ssl_info("https://self-signed.example.com", response)
+            again = await checker._get_ssl_info("https://self-signed.example.com", response)
+        
+        assert info and info['issuer'] == {}
+        assert again == info
+        assert open_connection.await_count == 1
     
     def test_calculate_health_score(self, checker):
         """Prueba el cálculo del score de salud."""
@@ -142,16 +378,29 @@ class TestWebsiteChecker:
         
         assert 0 <= score <= 100
         assert score > 80  # Debería ser alto dado que la mayoría de las métricas son buenas
-
+    
+    def test_calculate_health_scores_matches_single(self, checker):
+        """Prueba que el cálculo vectorizado coincide con el cálculo por URL."""
+        checker._update_metrics("https://a.com", CheckResult(status_code=200, response_time=250.0))
+        checker._update_metrics("https://a.com", CheckResult(status_code=500, response_time=750.0))
+        checker._update_metrics("https://b.com", CheckResult(status_code=200, response_time=2000.0))
+        checker.metrics["https://c.com"] = {'checks': 0}
+        
+        scores = checker.calculate_health_scores()
+        
+        assert scores["https://a.com"] == pytest.approx(checker.calculate_health_score("https://a.com"))
+        assert scores["https://b.com"] == pytest.approx(checker.calculate_health_score("https://b.com"))
+        assert scores["https://c.com"] == 0.0
+    
     def test_get_history_with_days(self, checker):
         """Prueba obtener historial filtrado por días."""
         url = "https://example.com"
         
         # Agregar algunos registros al historial
-        checker._history[url] = [
+        checker._history[url] = HistoryBuffer.from_checks([
             {'timestamp': datetime.now(), 'status_code': 200},
             {'timestamp': datetime.now(), 'status_code': 200},
-        ]
+        ], MAX_HISTORY_PER_URL)
         
         history = checker.get_history(url, days=1)
         
@@ -170,12 +419,45 @@ class TestWebsiteChecker:
         # El SSL info podría ser None en pruebas, pero no debería causar errores
         assert not hasattr(result, 'error') or result.error is None
     
+    def test_result_cache_expiry(self, checker):
+        """Prueba que los resultados cacheados expiran según cache_duration."""
+        url = "https://example.com"
+        result = CheckResult(status_code=200, response_time=1.0)
+        
+        checker._cache_result(url, result)
+        assert checker._get_cached_result(url) is result
+        
+        checker.cache_duration = 0
+        checker._cache_result(url, result)
+        assert checker._get_cached_result(url) is None
+        assert url not in checker._cache
+    
+    def test_check_result_timestamp(self):
+        """Prueba que cada resultado registra su propio timestamp."""
+        before = datetime.now()
+        result = CheckResult(status_code=200, response_time=1.0)
+        
+        assert result.timestamp >= before
+    
+    def test_history_is_bounded(self, checker):
+        """Prueba que el historial conserva solo los registros más recientes."""
+        url = "https://example.com"
+        
+        for i in range(MAX_HISTORY_PER_URL + 5):
+            checker._record_check(url, CheckResult(status_code=200, response_time=float(i)))
+        
+        history = checker.get_history(url)
+        
+        assert len(history) == MAX_HISTORY_PER_URL
+        assert history[0]['response_time'] == 5.0
+        assert history[-1]['response_time'] == float(MAX_HISTORY_PER_URL + 4)
+    
     def test_export_import_data(self, checker, tmp_path):
         """Prueba la exportación e importación de datos."""
         url = "https://example.com"
-        checker._history[url] = [
+        checker._history[url] = HistoryBuffer.from_checks([
             {'timestamp': datetime.now(), 'status_code': 200}
-        ]
+        ], MAX_HISTORY_PER_URL)
         
         # Exportar datos
         export_file = tmp_path / "export.json"
@@ -188,4 +470,23 @@ class TestWebsiteChecker:
         # Importar datos
         checker.import_data(str(export_file))
         assert len(checker._history) == 1
-        assert url in checker._history
\ No newline at end of file
+        assert url in checker._history
+    
+    @pytest.mark.parametrize('use_orjson', [True, False])
+    def test_export_import_metrics(self, checker, tmp_path, use_orjson):
+        """Prueba que las métricas sobreviven a la exportación con y sin orjson."""
+        url = "https://example.com"
+        checker._update_metrics(url, CheckResult(status_code=200, response_time=120.0))
+        checker._update_metrics(url, CheckResult(status_code=500, response_time=-1))
+        export_file = tmp_path / "export.json"
+        
+        backend = checker_module.orjson if use_orjson else None
+        with patch.object(checker_module, 'orjson', backend):
+            checker.export_data(str(export_file), indent=False)
+            checker.clear_history()
+            checker.import_data(str(export_file))
+        
+        stats = checker.get_statistics(url)
+        assert stats['total_checks'] == 2
+        assert stats['min_response_time'] == 120.0
+        assert isinstance(stats['last_check'], datetime)
\ No newline at end of file
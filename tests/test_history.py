@@ -0,0 +1,57 @@
+"""
+Test History Module
+-----------------
+Pruebas unitarias para el módulo core.history
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from src.core.history import HistoryBuffer
+
+@pytest.fixture
+def start():
+    """Fixture que proporciona una marca de tiempo de referencia."""
+    return datetime(2024, 1, 1, 12, 0, 0)
+
+class TestHistoryBuffer:
+    """Pruebas para la clase HistoryBuffer."""
+    
+    def test_keeps_latest_records(self, start):
+        """Prueba que solo se conservan los últimos maxlen registros."""
+        history = HistoryBuffer(maxlen=3)
+        for i in range(10):
+            history.append(start + timedelta(minutes=i), 200, float(i), f'error {i}')
+        
+        assert len(history) == 3
+        assert list(history.response_ms) == [7.0, 8.0, 9.0]
+        assert list(history.errors) == ['error 7', 'error 8', 'error 9']
+        assert len(history._timestamps) <= 6
+    
+    def test_records_as_dicts(self, start):
+        """Prueba la lectura de registros como diccionarios."""
+        history = HistoryBuffer(maxlen=5)
+        history.append(start, 503, -1, 'timeout')
+        
+        assert history[0] == {
+            'timestamp': start,
+            'status_code': 503,
+            'response_time': -1.0,
+            'error': 'timeout'
+        }
+        assert history[-1] == history[0]
+        with pytest.raises(IndexError):
+            history[1]
+    
+    def test_index_since(self, start):
+        """Prueba la búsqueda del primer registro posterior a una fecha."""
+        history = HistoryBuffer(maxlen=10)
+        for i in range(5):
+            history.append(start + timedelta(hours=i), 200, 100.0)
+        
+        index = history.index_since(start + timedelta(hours=2))
+        
+        assert index == 2
+        assert [r['timestamp'] for r in history.records(index)] == [
+            start + timedelta(hours=i) for i in range(2, 5)
+        ]
\ No newline at end of file
@@ -0,0 +1,91 @@
+"""
+Test Main Window Module
+---------------------
+Pruebas unitarias para el módulo gui.main_window
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+import threading
+from unittest.mock import Mock
+
+import pytest
+from src.gui import main_window
+from src.gui.main_window import MainWindow
+
+@pytest.fixture
+def window(monkeypatch):
+    """Fixture que proporciona una ventana sin Tk con el auto-refresh activado."""
+    monkeypatch.setattr(main_window, 'messagebox', Mock())
+    
+    window = object.__new__(MainWindow)
+    window.master = Mock()
+    window.master.after.return_value = 'after#1'
+    window.validator = Mock()
+    window.checker = Mock()
+    window.url_var = Mock()
+    window.auto_refresh_var = Mock()
+    window.auto_refresh_var.get.return_value = True
+    window._refresh_interval = 1
+    window._refresh_job = None
+    window._inflight = 0
+    window._last_url_edit = float('-inf')
+    return window
+
+class TestAutoRefresh:
+    """Pruebas para la verificación automática de MainWindow."""
+    
+    def test_empty_url_keeps_refresh(self, window):
+        """Prueba que un ciclo con la URL vacía programa el siguiente."""
+        window.url_var.get.return_value = '  '
+        window._schedule_refresh()
+        
+        window.master.after.assert_called_once_with(60 * 1000, window._schedule_refresh)
+        assert window._refresh_job == 'after#1'
+        main_window.messagebox.showwarning.assert_called_once()
+    
+    def test_invalid_url_keeps_refresh(self, window):
+        """Prueba que un ciclo con una URL inválida programa el siguiente."""
+        window.url_var.get.return_value = 'https://'
+        window.validator.is_valid_url.return_value = False
+        window._schedule_refresh()
+        
+        assert window._refresh_job == 'after#1'
+        window.checker.check_website.assert_not_called()
+    
+    def test_inflight_check_skips_tick(self, window):
+        """Prueba que se omite el ciclo si la verificación anterior sigue en curso."""
+        window._inflight = 1
+        window._schedule_refresh()
+        
+        assert window._refresh_job == 'after#1'
+        window.url_var.get.assert_not_called()
+
+class TestClosing:
+    """Pruebas para el cierre de MainWindow."""
+    
+    @pytest.mark.parametrize('version', [(3, 8), (3, 12)])
+    def test_pending_tasks_cancelled(self, window, monkeypatch, version):
+        """Prueba que al cerrar se cancelan las tareas que no han empezado."""
+        monkeypatch.setattr(main_window.sys, 'version_info', version)
+        window._pool = ThreadPoolExecutor(max_workers=1)
+        window._pending = set()
+        window._flush_url_history = Mock()
+        window.url_history = {}
+        started, release = threading.Event(), threading.Event()
+        
+        def blocking_task():
+            started.set()
+            return release.wait(5)
+        
+        running = window._submit(blocking_task)
+        queued = window._submit(lambda: None)
+        started.wait(5)
+        try:
+            window._on_closing()
+        finally:
+            release.set()
+        
+        assert queued.cancelled()
+        assert running.result() is True
+        assert not window._pending
+        window.master.destroy.assert_called_once()
\ No newline at end of file
@@ -0,0 +1,61 @@
+"""
+Test Metrics Module
+-----------------
+Pruebas unitarias para el módulo core.metrics
+"""
+
+import math
+import pytest
+from src.core.metrics import MetricsStore
+
+@pytest.fixture
+def store():
+    """Fixture que proporciona una instancia de MetricsStore."""
+    return MetricsStore(capacity=2)
+
+class TestMetricsStore:
+    """Pruebas para la clase MetricsStore."""
+    
+    def test_index_grows_capacity(self, store):
+        """Prueba que el almacén crece al agregar más URLs que su capacidad."""
+        for i in range(5):
+            assert store.index(f"https://example{i}.com") == i
+        
+        assert len(store) == 5
+        assert len(store.checks) >= 5
+        assert store.index("https://example0.com") == 0
+    
+    def test_set_and_get_item(self, store):
+        """Prueba la conversión entre diccionarios y filas."""
+        url = "https://example.com"
+        store[url] = {'checks': 4, 'successful': 3, 'failed': 1, 'total_response_time': 400.0}
+        
+        metrics = store[url]
+        
+        assert metrics['checks'] == 4
+        assert metrics['uptime_percentage'] == 75.0
+        assert math.isinf(metrics['min_response_time'])
+        assert metrics['last_check'] is None
+    
+    def test_delete_moves_last_row(self, store):
+        """Prueba que eliminar una URL conserva las métricas de las demás."""
+        store["https://a.com"] = {'checks': 1}
+        store["https://b.com"] = {'checks': 2}
+        store["https://c.com"] = {'checks': 3}
+        
+        del store["https://a.com"]
+        
+        assert "https://a.com" not in store
+        assert store["https://c.com"]['checks'] == 3
+        assert store["https://b.com"]['checks'] == 2
+        assert sorted(store) == ["https://b.com", "https://c.com"]
+    
+    def test_clear(self, store):
+        """Prueba la limpieza del almacén."""
+        store["https://example.com"] = {'checks': 1}
+        
+        store.clear()
+        
+        assert len(store) == 0
+        assert store.index("https://other.com") == 0
+        assert store["https://other.com"]['checks'] == 0
@@ -0,0 +1,135 @@
+"""
+Test Reports Module
+-----------------
+Pruebas unitarias para el módulo utils.reports
+"""
+
+from datetime import datetime, timedelta
+from unittest.mock import Mock
+import zipfile
+
+import numpy as np
+import pytest
+from src.core.history import HistoryBuffer
+from src.utils.reports import (
+    ReportGenerator, _minmax_indices, _sheet_name, _uptime_loop, _uptime_numpy
+)
+
+@pytest.fixture
+def checker():
+    """Fixture que proporciona un checker con historial simulado."""
+    now = datetime.now()
+    history = [
+        {'timestamp': now - timedelta(minutes=3), 'status_code': 200, 'response_time': 120.0, 'error': None},
+        {'timestamp': now - timedelta(minutes=2), 'status_code': 0, 'response_time': -1, 'error': 'timeout'},
+        {'timestamp': now - timedelta(minutes=1), 'status_code': 200, 'response_time': 80.0, 'error': None},
+    ]
+    mock = Mock()
+    mock.get_history_buffer.return_value = HistoryBuffer.from_checks(history, maxlen=3)
+    return mock
+
+class TestReportGenerator:
+    """Pruebas para la clase ReportGenerator."""
+    
+    def test_plot_response_times_reuses_figure(self, checker, tmp_path):
+        """Prueba que el gráfico reutiliza la figura y la línea en cada llamada."""
+        generator = ReportGenerator(checker)
+        assert generator.fig is None
+        
+        output = tmp_path / "first.png"
+        generator.plot_response_times("https://example.com", str(output))
+        fig, line = generator.fig, generator.line
+        generator.plot_response_times("https://example.com", str(tmp_path / "second.png"))
+        
+        assert output.exists()
+        assert generator.fig is fig
+        assert generator.line is line
+        assert list(line.get_ydata()) == [120.0, 80.0]
+    
+    def test_generate_uptime_report(self, checker):
+        """Prueba el cálculo del reporte de uptime."""
+        report = ReportGenerator(checker).generate_uptime_report("https://example.com")
+        
+        assert report['total_checks'] == 3
+        assert report['successful_checks'] == 2
+        assert report['uptime_percentage'] == pytest.approx(200 / 3)
+        assert report['average_response_time'] == pytest.approx(100.0)
+    
+    def test_sheet_names_are_valid_and_unique(self):
+        """Prueba que los nombres de hoja no tienen caracteres prohibidos ni se repiten."""
+        used = {'summary'}
+        long_url = "https://example.com/" + "a" * 40
+        names = [
+            _sheet_name(url, used)
+            for url in ("https://example.com/a?b=[c]", long_url, long_url + "b", "Summary")
+        ]
+        
+        assert names[0] == "example.comab=c"
+        assert all(len(name) <= 31 and not set(name) & set('[]:*?/\\') for name in names)
+        assert len({name.lower() for name in names}) == 4
+        assert names[3] == "Summary (2)"
+    
+    def test_export_to_excel(self, checker, tmp_path):
+        """Prueba que se escribe un libro con una hoja por URL."""
+        pytest.importorskip('xlsxwriter')
+        urls = ["https://example.com/" + "a" * 40, "https://example.com/" + "a" * 40 + "b"]
+        checker._history = dict.fromkeys(urls)
+        checker.get_statistics.return_value = {
+            'total_checks': 3, 'success_rate': 66.67, 'avg_response_time': 100.0
+        }
+        output = tmp_path / "report.xlsx"
+        
+        ReportGenerator(checker).export_to_excel(str(output))
+        
+        with zipfile.ZipFile(output) as xlsx:
+            sheets = [name for name in xlsx.namelist() if name.startswith('xl/worksheets/sheet')]
+        assert len(sheets) == 3
+    
+    def test_missing_history(self):
+        """Prueba el reporte de una URL sin historial."""
+        checker = Mock()
+        checker.get_history_buffer.return_value = None
+        report = ReportGenerator(checker).generate_uptime_report("https://example.com")
+        
+        assert report['total_checks'] == 0
+        assert report['average_response_time'] == 0
+    
+    def test_uptime_kernels_agree(self):
+        """Prueba que el kernel de una pasada y la versión NumPy coinciden."""
+        rng = np.random.default_rng(0)
+        ts = np.sort(rng.integers(0, 1000, 200)).astype(np.int64)
+        codes = rng.choice([0, 200, 500], 200).astype(np.int16)
+        rt = np.where(codes == 0, -1, rng.uniform(10, 500, 200)).astype(np.float32)
+        
+        total, ok, avg = _uptime_loop(codes, rt, ts, 250, 750)
+        expected = _uptime_numpy(codes, rt, ts, 250, 750)
+        
+        assert (total, ok) == expected[:2]
+        assert avg == pytest.approx(expected[2], rel=1e-5)
+    
+    def test_minmax_indices_keep_extremes(self):
+        """Prueba que la reducción conserva los picos y el orden temporal."""
+        y = np.sin(np.linspace(0, 20, 10001))
+        y[5000] = 10.0
+        
+        keep = _minmax_indices(y, 100)
+        
+        assert len(keep) <= 102
+        assert np.all(np.diff(keep) > 0)
+        assert 5000 in keep
+        assert keep[-1] == 10000
+    
+    def test_plot_large_history_is_reduced(self, tmp_path):
+        """Prueba que un historial largo se dibuja reducido y sin marcadores."""
+        start = datetime.now() - timedelta(days=1)
+        history = HistoryBuffer(maxlen=5000)
+        for i in range(5000):
+            history.append(start + timedelta(seconds=i), 200, float(i % 300))
+        checker = Mock()
+        checker.get_history_buffer.return_value = history
+        
+        generator = ReportGenerator(checker)
+        generator.plot_response_times("https://example.com", str(tmp_path / "large.png"))
+        
+        assert len(generator.line.get_xdata()) < 5000
+        assert generator.line.get_marker() == 'None'
\ No newline at end of file
@@ -4,16 +4,19 @@ Web Checker - Aplicación para verificar el estado de sitios web
 """
 
 import sys
-import tkinter as tk
-from src.gui.main_window import MainWindow
-from src.core.checker import WebsiteChecker
-from src.utils.validators import URLValidator
 
 def main():
+    # Importar la GUI y sus dependencias solo al arrancar la aplicación,
+    # para que importar este módulo no cargue tkinter ni aiohttp
+    import tkinter as tk
+    from src.gui.main_window import MainWindow
+    from src.core.checker import WebsiteChecker
+    from src.utils.validators import DEFAULT_VALIDATOR
+    
     try:
         # Inicializar el checker y el validador
         checker = WebsiteChecker()
-        validator = URLValidator()
+        validator = DEFAULT_VALIDATOR
         
         # Crear la ventana principal
         root = tk.Tk()
@@ -28,8 +31,8 @@ def main():
         screen_width = root.winfo_screenwidth()
         screen_height = root.winfo_screenheight()
         
-        center_x = int(screen_width/2 - window_width/2)
-        center_y = int(screen_height/2 - window_height/2)
+        center_x = (screen_width - window_width) // 2
+        center_y = (screen_height - window_height) // 2
         
         root.geometry(f'{window_width}x{window_height}+{center_x}+{center_y}')
         